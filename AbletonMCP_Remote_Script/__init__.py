@@ -2,7 +2,9 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 from _Framework.ControlSurface import ControlSurface
+import os
 import socket
+import struct
 import json
 import threading
 import time
@@ -16,6 +18,14 @@ except ImportError:
 
 # Constants for socket communication
 SOCKET_PATH = "/tmp/ableton_mcp.sock"
+# Messages in both directions are framed with a header of two big-endian u32s:
+# the body length and a request id, which each response echoes back
+FRAME_HEADER = struct.Struct(">II")
+# Report a vanished client as EPIPE rather than raising SIGPIPE, where supported
+SEND_FLAGS = getattr(socket, "MSG_NOSIGNAL", 0)
+# Success responses always start with this exact prefix so the server can
+# forward the result JSON without parsing it
+RESULT_PREFIX = '{"status": "success", "result": '
 
 def create_instance(c_instance):
     """Create and return the AbletonMCP script instance"""
@@ -48,7 +58,6 @@ class AbletonMCP(ControlSurface):
     
     def disconnect(self):
         """Called when Ableton closes or the control surface is removed"""
-        import os
         self.log_message("AbletonMCP disconnecting...")
         self.running = False
 
@@ -81,7 +90,6 @@ class AbletonMCP(ControlSurface):
     
     def start_server(self):
         """Start the Unix domain socket server in a separate thread"""
-        import os
         try:
             # Remove socket file if it already exists
             try:
@@ -144,51 +152,61 @@ class AbletonMCP(ControlSurface):
         except Exception as e:
             self.log_message("Server thread error: " + str(e))
     
+    def _recv_exactly(self, client, size):
+        """Read exactly size bytes from the client, or None if it disconnected"""
+        chunks = []
+        remaining = size
+        while remaining:
+            chunk = client.recv(min(remaining, 65536))
+            if not chunk:
+                return None
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
+    
+    def _send_message(self, client, message, request_id=0):
+        """Send a framed JSON message to the client"""
+        if message.get("status") == "success" and len(message) == 2:
+            data = RESULT_PREFIX + json.dumps(message["result"]) + "}"
+        else:
+            data = json.dumps(message)
+        if not isinstance(data, bytes):
+            # Python 3: encode string to bytes (Python 2 str is already bytes)
+            data = data.encode('utf-8')
+        # Header and body go out in a single call
+        client.sendall(FRAME_HEADER.pack(len(data), request_id) + data, SEND_FLAGS)
+    
     def _handle_client(self, client):
         """Handle communication with a connected client"""
         self.log_message("Client handler started")
         client.settimeout(None)  # No timeout for client socket
-        buffer = ''  # Changed from b'' to '' for Python 2
+        if hasattr(socket, "SO_NOSIGPIPE"):
+            # macOS has no MSG_NOSIGNAL; suppress SIGPIPE on the socket instead
+            client.setsockopt(socket.SOL_SOCKET, socket.SO_NOSIGPIPE, 1)
         
         try:
             while self.running:
+                request_id = 0
                 try:
-                    # Receive data
-                    data = client.recv(8192)
+                    # Receive one framed command
+                    body = None
+                    header = self._recv_exactly(client, FRAME_HEADER.size)
+                    if header is not None:
+                        size, request_id = FRAME_HEADER.unpack(header)
+                        body = self._recv_exactly(client, size)
                     
-                    if not data:
+                    if body is None:
                         # Client disconnected
                         self.log_message("Client disconnected")
                         break
                     
-                    # Accumulate data in buffer with explicit encoding/decoding
-                    try:
-                        # Python 3: data is bytes, decode to string
-                        buffer += data.decode('utf-8')
-                    except AttributeError:
-                        # Python 2: data is already string
-                        buffer += data
+                    command = json.loads(body)
                     
-                    try:
-                        # Try to parse command from buffer
-                        command = json.loads(buffer)  # Removed decode('utf-8')
-                        buffer = ''  # Clear buffer after successful parse
-                        
-                        self.log_message("Received command: " + str(command.get("type", "unknown")))
-                        
-                        # Process the command and get response
-                        response = self._process_command(command)
-                        
-                        # Send the response with explicit encoding
-                        try:
-                            # Python 3: encode string to bytes
-                            client.sendall(json.dumps(response).encode('utf-8'))
-                        except AttributeError:
-                            # Python 2: string is already bytes
-                            client.sendall(json.dumps(response))
-                    except ValueError:
-                        # Incomplete data, wait for more
-                        continue
+                    self.log_message("Received command: " + str(command.get("type", "unknown")))
+                    
+                    # Process the command and send the response
+                    response = self._process_command(command)
+                    self._send_message(client, response, request_id)
                         
                 except Exception as e:
                     self.log_message("Error handling client data: " + str(e))
@@ -200,16 +218,13 @@ class AbletonMCP(ControlSurface):
                         "message": str(e)
                     }
                     try:
-                        # Python 3: encode string to bytes
-                        client.sendall(json.dumps(error_response).encode('utf-8'))
-                    except AttributeError:
-                        # Python 2: string is already bytes
-                        client.sendall(json.dumps(error_response))
+                        self._send_message(client, error_response, request_id)
                     except:
                         # If we can't send the error, the connection is probably dead
                         break
                     
-                    # For serious errors, break the loop
+                    # A malformed frame body was fully consumed, so keep serving;
+                    # for serious errors, break the loop
                     if not isinstance(e, ValueError):
                         break
         except Exception as e:
@@ -242,7 +257,9 @@ class AbletonMCP(ControlSurface):
             elif command_type == "get_device_parameters":
                 track_index = params.get("track_index", 0)
                 device_index = params.get("device_index", 0)
-                response["result"] = self._get_device_parameters(track_index, device_index)
+                response["result"] = self._get_device_parameters(track_index, device_index,
+                                                                 params.get("offset", 0), params.get("page_size", None),
+                                                                 params.get("summary_only", False))
             elif command_type == "get_notes_from_clip":
                 track_index = params.get("track_index", 0)
                 clip_index = params.get("clip_index", 0)
@@ -273,19 +290,21 @@ class AbletonMCP(ControlSurface):
                 device_index = params.get("device_index", 0)
                 chain_index = params.get("chain_index", 0)
                 chain_device_index = params.get("chain_device_index", 0)
-                response["result"] = self._get_rack_chain_device_parameters(track_index, device_index, chain_index, chain_device_index)
+                response["result"] = self._get_rack_chain_device_parameters(track_index, device_index, chain_index, chain_device_index,
+                                                                             params.get("offset", 0), params.get("page_size", None),
+                                                                             params.get("summary_only", False))
             elif command_type == "get_rack_macro_mappings":
                 track_index = params.get("track_index", 0)
                 device_index = params.get("device_index", 0)
                 response["result"] = self._get_rack_macro_mappings(track_index, device_index)
             # Commands that modify Live's state should be scheduled on the main thread
             elif command_type in ["create_midi_track", "set_track_name",
-                                 "create_clip", "add_notes_to_clip", "add_new_notes_to_clip", "set_clip_name",
-                                 "remove_notes_from_clip", "modify_notes_in_clip", "select_notes_from_clip",
+                                 "create_clip", "add_notes_to_clip", "add_new_notes_to_clip", "add_notes_batch",
+                                 "set_clip_name", "remove_notes_from_clip", "modify_notes_in_clip", "select_notes_from_clip",
                                  "set_track_volume", "set_track_pan", "set_track_mute", "set_track_solo", "set_track_arm",
                                  "delete_track", "delete_clip", "duplicate_clip", "duplicate_track",
                                  "set_clip_loop", "set_clip_color",
-                                 "add_automation_point", "clear_automation",
+                                 "add_automation_point", "add_automation_points", "clear_automation",
                                  "create_scene", "delete_scene", "fire_scene",
                                  "set_loop_start", "set_loop_end", "set_playback_position", "set_metronome",
                                  "quantize_notes", "transpose_notes", "create_audio_track",
@@ -321,6 +340,8 @@ class AbletonMCP(ControlSurface):
                             clip_index = params.get("clip_index", 0)
                             notes = params.get("notes", [])
                             result = self._add_new_notes_to_clip(track_index, clip_index, notes)
+                        elif command_type == "add_notes_batch":
+                            result = self._add_notes_batch(params.get("operations", []))
                         elif command_type == "set_clip_name":
                             track_index = params.get("track_index", 0)
                             clip_index = params.get("clip_index", 0)
@@ -359,7 +380,7 @@ class AbletonMCP(ControlSurface):
                         elif command_type == "set_device_parameters":
                             track_index = params.get("track_index", 0)
                             device_index = params.get("device_index", 0)
-                            parameters = params.get("parameters", [])
+                            parameters = self._parameter_rows(params)
                             result = self._set_device_parameters(track_index, device_index, parameters)
                         elif command_type == "map_parameter_to_macro":
                             track_index = params.get("track_index", 0)
@@ -374,7 +395,7 @@ class AbletonMCP(ControlSurface):
                             result = self._remove_notes_from_clip(params.get("track_index", 0), params.get("clip_index", 0),
                                                                   params.get("note_ids", None), params.get("from_time", None),
                                                                   params.get("to_time", None), params.get("from_pitch", None),
-                                                                  params.get("to_pitch", None))
+                                                                  params.get("to_pitch", None), params.get("ranges", None))
                         elif command_type == "modify_notes_in_clip":
                             result = self._modify_notes_in_clip(params.get("track_index", 0), params.get("clip_index", 0),
                                                                params.get("modifications", []))
@@ -414,6 +435,9 @@ class AbletonMCP(ControlSurface):
                             result = self._add_automation_point(params.get("track_index", 0), params.get("device_index", 0),
                                                                params.get("parameter_index", 0), params.get("time", 0.0),
                                                                params.get("value", 0.5))
+                        elif command_type == "add_automation_points":
+                            result = self._add_automation_points(params.get("track_index", 0), params.get("device_index", 0),
+                                                                params.get("parameter_index", 0), params.get("points", []))
                         elif command_type == "clear_automation":
                             result = self._clear_automation(params.get("track_index", 0), params.get("device_index", 0),
                                                            params.get("parameter_index", 0))
@@ -806,6 +830,33 @@ class AbletonMCP(ControlSurface):
             self.log_message(traceback.format_exc())
             raise
     
+    def _add_notes_batch(self, operations):
+        """Add MIDI notes to several clips as a single undo step (keeps existing notes)"""
+        try:
+            results = []
+            self._song.begin_undo_step()
+            try:
+                for operation in operations:
+                    track_index = operation.get("track_index", 0)
+                    clip_index = operation.get("clip_index", 0)
+                    added = self._add_new_notes_to_clip(track_index, clip_index, operation.get("notes", []))
+                    results.append({
+                        "track_index": track_index,
+                        "clip_index": clip_index,
+                        "note_count": added["note_count"]
+                    })
+            finally:
+                self._song.end_undo_step()
+
+            return {
+                "operation_count": len(results),
+                "note_count": sum(r["note_count"] for r in results),
+                "results": results
+            }
+        except Exception as e:
+            self.log_message("Error adding notes batch: " + str(e))
+            raise
+
     def _set_clip_name(self, track_index, clip_index, name):
         """Set the name of a clip"""
         try:
@@ -1354,8 +1405,22 @@ class AbletonMCP(ControlSurface):
             self.log_message(traceback.format_exc())
             raise
 
-    def _get_device_parameters(self, track_index, device_index):
-        """Get all parameters for a device"""
+    def _parameter_page(self, total, offset, page_size):
+        """Return the parameter indices of one page and the offset of the next page
+
+        page_size None means everything from offset on; the next offset is None
+        once the page reaches the last parameter.
+        """
+        offset = max(0, offset or 0)
+        end = total if page_size is None else min(total, offset + max(1, page_size))
+        return range(offset, end), (end if end < total else None)
+
+    def _get_device_parameters(self, track_index, device_index, offset=0, page_size=None, summary_only=False):
+        """Get a page of parameters for a device
+
+        Pages cover raw parameter indices, so filtered-out parameters leave a page
+        short. With summary_only each parameter is reduced to its index and name.
+        """
         try:
             if track_index < 0 or track_index >= len(self._song.tracks):
                 raise IndexError("Track index out of range")
@@ -1370,9 +1435,12 @@ class AbletonMCP(ControlSurface):
             # Detect if this is a 3rd party plugin
             is_plugin = "PluginDevice" in device.class_name or "AuPluginDevice" in device.class_name
 
-            # Get all parameters for the device
+            # Get the requested page of parameters for the device
+            device_parameters = device.parameters
+            page, next_offset = self._parameter_page(len(device_parameters), offset, page_size)
             parameters = []
-            for param_index, param in enumerate(device.parameters):
+            for param_index in page:
+                param = device_parameters[param_index]
                 # For 3rd party plugins, include ALL parameters (they're all relevant)
                 # For native devices, apply filtering to reduce noise
                 if not is_plugin:
@@ -1384,6 +1452,10 @@ class AbletonMCP(ControlSurface):
                     if not hasattr(param, 'name') or not param.name:
                         continue
 
+                if summary_only:
+                    parameters.append({"index": param_index, "name": param.name})
+                    continue
+
                 param_info = {
                     "index": param_index,
                     "name": param.name if hasattr(param, 'name') else "Parameter " + str(param_index),
@@ -1408,14 +1480,28 @@ class AbletonMCP(ControlSurface):
                 "device_type": self._get_device_type(device),
                 "is_plugin": is_plugin,
                 "parameter_count": len(parameters),
-                "total_parameters": len(device.parameters),
-                "parameters": parameters
+                "total_parameters": len(device_parameters),
+                "parameters": parameters,
+                "next_offset": next_offset
             }
         except Exception as e:
             self.log_message("Error getting device parameters: " + str(e))
             self.log_message(traceback.format_exc())
             raise
     
+    def _parameter_at_hint(self, device, parameter_name, parameter_index):
+        """Return the parameter at parameter_index if it carries parameter_name
+
+        Clients send a cached index alongside the name to skip the name scan;
+        when the index is stale the caller falls back to scanning.
+        """
+        if parameter_name is None or parameter_index is None:
+            return None
+        parameters = device.parameters
+        if 0 <= parameter_index < len(parameters) and parameters[parameter_index].name == parameter_name:
+            return parameters[parameter_index]
+        return None
+
     def _set_device_parameter(self, track_index, device_index, parameter_name=None, parameter_index=None, value=None):
         """Set a device parameter by name or index"""
         try:
@@ -1430,12 +1516,16 @@ class AbletonMCP(ControlSurface):
             device = track.devices[device_index]
             
             # Find the parameter by name or index
-            parameter = None
-            if parameter_name is not None:
+            parameter = self._parameter_at_hint(device, parameter_name, parameter_index)
+            if parameter is not None:
+                # The client's cached index already points at the named parameter
+                pass
+            elif parameter_name is not None:
                 # Find parameter by name
-                for param in device.parameters:
+                for i, param in enumerate(device.parameters):
                     if param.name == parameter_name:
                         parameter = param
+                        parameter_index = i
                         break
                 
                 if parameter is None:
@@ -1500,7 +1590,7 @@ class AbletonMCP(ControlSurface):
             return {
                 "device_name": device.name,
                 "parameter_name": parameter.name,
-                "parameter_index": list(device.parameters).index(parameter),
+                "parameter_index": parameter_index,
                 "value": parameter.value,
                 "min": parameter.min,
                 "max": parameter.max
@@ -1510,8 +1600,22 @@ class AbletonMCP(ControlSurface):
             self.log_message(traceback.format_exc())
             raise
 
+    def _parameter_rows(self, params):
+        """Return (name, index, value) rows from a set_device_parameters request
+
+        Requests carry either parallel "names"/"indices"/"values" lists or a
+        "parameters" list of dicts; either list of names or indices may be absent.
+        """
+        if "values" in params:
+            values = params["values"]
+            names = params.get("names") or [None] * len(values)
+            indices = params.get("indices") or [None] * len(values)
+            return list(zip(names, indices, values))
+        return [(p.get('parameter_name'), p.get('parameter_index'), p.get('value'))
+                for p in params.get("parameters", [])]
+
     def _set_device_parameters(self, track_index, device_index, parameters):
-        """Set multiple device parameters at once"""
+        """Set multiple device parameters at once from (name, index, value) rows"""
         try:
             if track_index < 0 or track_index >= len(self._song.tracks):
                 raise IndexError("Track index out of range")
@@ -1525,19 +1629,19 @@ class AbletonMCP(ControlSurface):
 
             results = []
 
-            for param_config in parameters:
+            for parameter_name, parameter_index, value in parameters:
                 try:
-                    parameter_name = param_config.get('parameter_name')
-                    parameter_index = param_config.get('parameter_index')
-                    value = param_config.get('value')
-
                     # Find the parameter by name or index
-                    parameter = None
-                    if parameter_name is not None:
+                    parameter = self._parameter_at_hint(device, parameter_name, parameter_index)
+                    if parameter is not None:
+                        # The client's cached index already points at the named parameter
+                        pass
+                    elif parameter_name is not None:
                         # Find parameter by name
-                        for param in device.parameters:
+                        for i, param in enumerate(device.parameters):
                             if param.name == parameter_name:
                                 parameter = param
+                                parameter_index = i
                                 break
 
                         if parameter is None:
@@ -1642,7 +1746,7 @@ class AbletonMCP(ControlSurface):
                     results.append({
                         "success": True,
                         "parameter_name": parameter.name,
-                        "parameter_index": list(device.parameters).index(parameter),
+                        "parameter_index": parameter_index,
                         "value": parameter.value,
                         "min": parameter.min,
                         "max": parameter.max
@@ -1652,7 +1756,7 @@ class AbletonMCP(ControlSurface):
                     self.log_message("Error setting parameter: " + str(e))
                     results.append({
                         "success": False,
-                        "parameter_name": param_config.get('parameter_name', 'unknown'),
+                        "parameter_name": parameter_name if parameter_name is not None else 'unknown',
                         "error": str(e)
                     })
 
@@ -1850,7 +1954,8 @@ class AbletonMCP(ControlSurface):
             self.log_message(traceback.format_exc())
             raise
 
-    def _get_rack_chain_device_parameters(self, track_index, device_index, chain_index, chain_device_index):
+    def _get_rack_chain_device_parameters(self, track_index, device_index, chain_index, chain_device_index,
+                                          offset=0, page_size=None, summary_only=False):
         """
         Get parameters from a device inside a rack's chain.
 
@@ -1859,8 +1964,11 @@ class AbletonMCP(ControlSurface):
             device_index: Index of the rack device
             chain_index: Index of the chain
             chain_device_index: Index of the device inside the chain
+            offset: Index of the first parameter to return
+            page_size: Maximum number of parameters to return (None for all)
+            summary_only: Return only each parameter's index and name
 
-        Returns all parameters for the device inside the rack's chain.
+        Returns one page of parameters for the device inside the rack's chain.
         """
         try:
             if track_index < 0 or track_index >= len(self._song.tracks):
@@ -1887,10 +1995,17 @@ class AbletonMCP(ControlSurface):
 
             chain_device = chain.devices[chain_device_index]
 
-            # Get all parameters
+            # Get the requested page of parameters
+            chain_parameters = chain_device.parameters
+            page, next_offset = self._parameter_page(len(chain_parameters), offset, page_size)
             parameters = []
-            for param_idx, param in enumerate(chain_device.parameters):
+            for param_idx in page:
+                param = chain_parameters[param_idx]
                 try:
+                    if summary_only:
+                        parameters.append({"index": param_idx, "name": param.name})
+                        continue
+
                     param_info = {
                         "index": param_idx,
                         "name": param.name if hasattr(param, 'name') else f"Parameter {param_idx}",
@@ -1916,7 +2031,8 @@ class AbletonMCP(ControlSurface):
                 "device_name": chain_device.name,
                 "device_class": chain_device.class_name,
                 "device_type": self._get_device_type(chain_device),
-                "parameters": parameters
+                "parameters": parameters,
+                "next_offset": next_offset
             }
         except Exception as e:
             self.log_message("Error getting rack chain device parameters: " + str(e))
@@ -1927,8 +2043,12 @@ class AbletonMCP(ControlSurface):
     # NOTE MANIPULATION METHODS
     # ============================================================================
 
-    def _remove_notes_from_clip(self, track_index, clip_index, note_ids=None, from_time=None, to_time=None, from_pitch=None, to_pitch=None):
-        """Remove notes from a clip by note IDs or time/pitch range"""
+    def _remove_notes_from_clip(self, track_index, clip_index, note_ids=None, from_time=None, to_time=None, from_pitch=None, to_pitch=None, ranges=None):
+        """Remove notes from a clip by note IDs or time/pitch range
+
+        ranges is a list of from_time/to_time/from_pitch/to_pitch dicts; when it
+        is given, note_ids and every range are removed in one call.
+        """
         try:
             track = self._song.tracks[track_index]
             clip_slot = track.clip_slots[clip_index]
@@ -1936,28 +2056,39 @@ class AbletonMCP(ControlSurface):
                 raise Exception("No clip in slot")
             clip = clip_slot.clip
 
+            if ranges is not None:
+                if note_ids:
+                    clip.remove_notes_by_id(tuple(note_ids))
+                removed_ranges = [self._remove_note_range(clip, r.get("from_time"), r.get("to_time"),
+                                                          r.get("from_pitch"), r.get("to_pitch"))
+                                  for r in ranges]
+                return {"removed_count": len(note_ids or ()), "removed_ranges": removed_ranges}
+
             if note_ids:
                 # Remove specific notes by ID
                 clip.remove_notes_by_id(tuple(note_ids))
                 return {"removed_count": len(note_ids)}
             else:
-                # Remove notes by range
-                if from_time is None:
-                    from_time = 0
-                if to_time is None:
-                    to_time = clip.length
-                if from_pitch is None:
-                    from_pitch = 0
-                if to_pitch is None:
-                    to_pitch = 127
-
-                clip.remove_notes_extended(from_time, from_pitch, to_time - from_time, to_pitch - from_pitch + 1)
-                return {"removed_range": {"from_time": from_time, "to_time": to_time, "from_pitch": from_pitch, "to_pitch": to_pitch}}
+                return {"removed_range": self._remove_note_range(clip, from_time, to_time, from_pitch, to_pitch)}
         except Exception as e:
             self.log_message("Error removing notes: " + str(e))
             self.log_message(traceback.format_exc())
             raise
 
+    def _remove_note_range(self, clip, from_time, to_time, from_pitch, to_pitch):
+        """Remove the notes in a time/pitch range, defaulting to the whole clip"""
+        if from_time is None:
+            from_time = 0
+        if to_time is None:
+            to_time = clip.length
+        if from_pitch is None:
+            from_pitch = 0
+        if to_pitch is None:
+            to_pitch = 127
+
+        clip.remove_notes_extended(from_time, from_pitch, to_time - from_time, to_pitch - from_pitch + 1)
+        return {"from_time": from_time, "to_time": to_time, "from_pitch": from_pitch, "to_pitch": to_pitch}
+
     def _modify_notes_in_clip(self, track_index, clip_index, modifications):
         """Modify existing notes in a clip (Live 11+)"""
         try:
@@ -2233,28 +2364,43 @@ class AbletonMCP(ControlSurface):
     # AUTOMATION METHODS
     # ============================================================================
 
+    def _automation_envelope(self, track_index, device_index, parameter_index):
+        """Get the automation envelope of a device parameter"""
+        track = self._song.tracks[track_index]
+        device = track.devices[device_index]
+        parameter = device.parameters[parameter_index]
+
+        # Note: This requires accessing automation envelopes which may not be directly
+        # available in all Live versions. This is a simplified implementation.
+        if not hasattr(parameter, 'automation_envelope'):
+            raise Exception("Automation not supported for this parameter")
+        envelope = parameter.automation_envelope
+        if not envelope:
+            raise Exception("Parameter has no automation envelope")
+        return envelope
+
     def _add_automation_point(self, track_index, device_index, parameter_index, time, value):
         """Add an automation point to a parameter"""
         try:
-            track = self._song.tracks[track_index]
-            device = track.devices[device_index]
-            parameter = device.parameters[parameter_index]
-
-            # Note: This requires accessing automation envelopes which may not be directly
-            # available in all Live versions. This is a simplified implementation.
-            if hasattr(parameter, 'automation_envelope'):
-                envelope = parameter.automation_envelope
-                if envelope:
-                    envelope.insert_step(time, 0, value)
-                    return {"added": True, "time": time, "value": value}
-                else:
-                    raise Exception("Parameter has no automation envelope")
-            else:
-                raise Exception("Automation not supported for this parameter")
+            envelope = self._automation_envelope(track_index, device_index, parameter_index)
+            envelope.insert_step(time, 0, value)
+            return {"added": True, "time": time, "value": value}
         except Exception as e:
             self.log_message("Error adding automation point: " + str(e))
             raise
 
+    def _add_automation_points(self, track_index, device_index, parameter_index, points):
+        """Add several automation points to a parameter in one pass"""
+        try:
+            envelope = self._automation_envelope(track_index, device_index, parameter_index)
+            insert_step = envelope.insert_step
+            for point in points:
+                insert_step(point.get("time", 0.0), 0, point.get("value", 0.5))
+            return {"added": len(points)}
+        except Exception as e:
+            self.log_message("Error adding automation points: " + str(e))
+            raise
+
     def _clear_automation(self, track_index, device_index, parameter_index):
         """Clear automation for a parameter"""
         try:
@@ -2399,19 +2545,18 @@ class AbletonMCP(ControlSurface):
             # Get all notes
             notes = clip.get_notes_extended(0, 0, clip.length, 128)
 
-            # Quantize and modify each note
-            modifications = []
-            for note in notes:
-                quantized_start = round(note.start_time / quantize_to) * quantize_to
-                modifications.append({
-                    "note_id": note.note_id,
-                    "start_time": quantized_start
-                })
+            # Quantize in one pass, only touching notes that are off the grid
+            modifications = tuple(
+                {"note_id": note.note_id, "start_time": start}
+                for note, start in ((note, round(note.start_time / quantize_to) * quantize_to) for note in notes)
+                if start != note.start_time
+            )
 
             if modifications:
-                clip.apply_note_modifications(tuple(modifications))
+                clip.apply_note_modifications(modifications)
 
-            return {"quantized": True, "note_count": len(modifications), "quantize_to": quantize_to}
+            return {"quantized": True, "note_count": len(notes), "changed_count": len(modifications),
+                    "quantize_to": quantize_to}
         except Exception as e:
             self.log_message("Error quantizing notes: " + str(e))
             raise
@@ -2431,19 +2576,18 @@ class AbletonMCP(ControlSurface):
             # Get all notes
             notes = clip.get_notes_extended(0, 0, clip.length, 128)
 
-            # Transpose each note
-            modifications = []
-            for note in notes:
-                new_pitch = max(0, min(127, note.pitch + semitones))
-                modifications.append({
-                    "note_id": note.note_id,
-                    "pitch": new_pitch
-                })
+            # Transpose in one pass, skipping notes already clamped at the range edge
+            modifications = tuple(
+                {"note_id": note.note_id, "pitch": pitch}
+                for note, pitch in ((note, max(0, min(127, note.pitch + semitones))) for note in notes)
+                if pitch != note.pitch
+            )
 
             if modifications:
-                clip.apply_note_modifications(tuple(modifications))
+                clip.apply_note_modifications(modifications)
 
-            return {"transposed": True, "note_count": len(modifications), "semitones": semitones}
+            return {"transposed": True, "note_count": len(notes), "changed_count": len(modifications),
+                    "semitones": semitones}
         except Exception as e:
             self.log_message("Error transposing notes: " + str(e))
             raise
@@ -2471,6 +2615,10 @@ class AbletonMCP(ControlSurface):
             creator: Filter by creator/vendor folder name (e.g., "FabFilter", "Waves")
             plugin_type: Filter by type ("instrument", "audio_effect", "midi_effect")
             format_filter: Filter by format folder ("VST", "AUv2", "VST3", etc.)
+
+        Each plugin also carries format_folder, the browser folder it was found
+        in (None for a plugin directly under Plug-Ins), so format filters can
+        match either it or the format detected from the URI.
         """
         try:
             app = self.application()
@@ -2484,7 +2632,6 @@ class AbletonMCP(ControlSurface):
             if not hasattr(browser, 'plugins'):
                 return {
                     "plugins": [],
-                    "count": 0,
                     "message": "Plug-Ins category not found in browser"
                 }
 
@@ -2530,7 +2677,7 @@ class AbletonMCP(ControlSurface):
                 return "audio_effect"
 
             # Collect plugins from vendor folders
-            def collect_from_vendor(vendor_folder, vendor_name):
+            def collect_from_vendor(vendor_folder, vendor_name, format_name):
                 """Collect plugins from a vendor folder, using the folder name as vendor"""
                 vendor_plugins = []
 
@@ -2553,6 +2700,7 @@ class AbletonMCP(ControlSurface):
                                         "uri": plugin_uri,
                                         "vendor": vendor_name,  # Use folder name as vendor
                                         "format": plugin_format,
+                                        "format_folder": format_name,
                                         "type": plugin_type_detected
                                     }
                                     vendor_plugins.append(plugin_info)
@@ -2591,6 +2739,7 @@ class AbletonMCP(ControlSurface):
                                 "uri": plugin_uri,
                                 "vendor": plugin_vendor,
                                 "format": plugin_format,
+                                "format_folder": None,
                                 "type": plugin_type_detected
                             })
                         elif hasattr(format_folder, 'children') and format_folder.children:
@@ -2620,21 +2769,21 @@ class AbletonMCP(ControlSurface):
                                             "uri": plugin_uri,
                                             "vendor": plugin_vendor,
                                             "format": plugin_format,
+                                            "format_folder": format_name,
                                             "type": plugin_type_detected
                                         })
                                     elif hasattr(vendor_folder, 'children'):
                                         # Vendor folder containing plugins
-                                        vendor_plugins = collect_from_vendor(vendor_folder, vendor_name)
+                                        vendor_plugins = collect_from_vendor(vendor_folder, vendor_name, format_name)
                                         all_plugins.extend(vendor_plugins)
                                 except Exception as e:
                                     self.log_message("Error processing vendor folder: " + str(e))
                     except Exception as e:
                         self.log_message("Error processing format folder: " + str(e))
 
-            # Return all plugins without filtering (filtering done on MCP server side)
+            # The MCP server filters and counts the full list itself
             return {
-                "plugins": all_plugins,
-                "count": len(all_plugins)
+                "plugins": all_plugins
             }
         except Exception as e:
             self.log_message("Error getting third party plugins: " + str(e))
@@ -2708,7 +2857,6 @@ class AbletonMCP(ControlSurface):
 
             return {
                 "plugins": plugins,
-                "count": len(plugins),
                 "plugin_type": plugin_type
             }
         except Exception as e:
@@ -1,171 +1,407 @@
 # ableton_mcp_server.py
 from mcp.server.fastmcp import FastMCP, Context
-import socket
+import asyncio
+import base64
+import inspect
+import struct
 import json
 import logging
-from dataclasses import dataclass
+import os
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, List, Union, Optional
+from typing import AsyncIterator, Callable, Dict, Any, List, Union, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("AbletonMCPServer")
 
+# orjson serializes tool output in C; stdlib json only stays as a fallback for
+# environments without an orjson build, where indent=2 output is pure Python
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes"""
+        return orjson.dumps(obj)
+
+    def _format_json(obj: Any) -> str:
+        """Serialize obj to an indented JSON string for tool output"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+    def _compact_json(obj: Any) -> str:
+        """Serialize obj to a one-line JSON string for short tool acknowledgements"""
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _loads = json.loads
+    # Built once; json.dumps would configure a fresh encoder on every call. Like
+    # orjson, they leave non-ASCII text unescaped
+    _compact_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    _indent_encoder = json.JSONEncoder(ensure_ascii=False, indent=2, separators=(",", ": "))
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes"""
+        return _compact_encoder.encode(obj).encode('utf-8')
+
+    def _format_json(obj: Any) -> str:
+        """Serialize obj to an indented JSON string for tool output"""
+        return _indent_encoder.encode(obj)
+
+    def _compact_json(obj: Any) -> str:
+        """Serialize obj to a one-line JSON string for short tool acknowledgements"""
+        return _compact_encoder.encode(obj)
+
+# zstd compresses large plugin listings better and faster than zlib, which
+# stands in when the optional zstandard package is missing
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Messages in both directions are framed with a header of two big-endian u32s:
+# the body length and a request id, which responses echo so that several
+# requests can be in flight on one connection
+_FRAME_HEADER = struct.Struct(">II")
+# Every success response from the Remote Script starts with this exact prefix
+_RAW_RESULT_PREFIX = b'{"status": "success", "result": '
+
+# Commands that modify Live's state
+_MODIFYING_COMMANDS = frozenset((
+    "create_midi_track", "create_audio_track", "set_track_name",
+    "create_clip", "add_notes_to_clip", "add_new_notes_to_clip", "add_notes_batch", "set_clip_name",
+    "remove_notes_from_clip", "modify_notes_in_clip", "select_notes_from_clip",
+    "set_track_volume", "set_track_pan", "set_track_mute", "set_track_solo", "set_track_arm",
+    "delete_track", "duplicate_track", "delete_clip", "duplicate_clip",
+    "set_clip_loop", "set_clip_color", "add_automation_point", "add_automation_points", "clear_automation",
+    "create_scene", "delete_scene", "fire_scene",
+    "set_loop_start", "set_loop_end", "set_playback_position", "set_metronome",
+    "quantize_notes", "transpose_notes",
+    "set_tempo", "fire_clip", "stop_clip", "set_device_parameter", "set_device_parameters",
+    "start_playback", "stop_playback", "load_instrument_or_effect", "load_browser_item",
+))
+
+# Commands that only read Live's state
+_READONLY_COMMANDS = frozenset((
+    "get_session_info", "get_track_info", "get_notes_from_clip", "get_clip_info",
+    "get_device_parameters", "get_rack_chain_devices", "get_rack_chain_device_parameters",
+    "get_rack_macro_mappings", "get_scenes_info", "get_playback_position",
+    "get_browser_tree", "get_browser_items_at_path", "get_plugins_list", "get_third_party_plugins",
+))
+
+# Commands after which devices may sit at different track/device indices
+_STRUCTURAL_COMMANDS = frozenset((
+    "create_midi_track", "create_audio_track", "delete_track", "duplicate_track",
+    "delete_clip", "duplicate_clip", "create_scene", "delete_scene",
+    "load_instrument_or_effect", "load_browser_item",
+))
+
+# Response timeouts (seconds) by expected cost; anything not listed waits 15 s if
+# it modifies Live's state and 10 s otherwise
+_TIMEOUTS = {
+    # Cheap property setters and transport control
+    **dict.fromkeys((
+        "set_tempo", "set_track_name", "set_clip_name", "set_clip_color",
+        "set_track_volume", "set_track_pan", "set_track_mute", "set_track_solo", "set_track_arm",
+        "fire_clip", "stop_clip", "fire_scene", "start_playback", "stop_playback",
+        "set_loop_start", "set_loop_end", "set_playback_position", "set_metronome",
+        "get_playback_position",
+    ), 2.0),
+    # Small structural edits and single-object reads
+    **dict.fromkeys((
+        "create_midi_track", "create_audio_track", "create_clip", "create_scene", "delete_scene",
+        "delete_clip", "set_clip_loop", "get_session_info", "get_track_info", "get_clip_info",
+        "get_scenes_info",
+    ), 5.0),
+    # Loading devices and walking the browser can take a long time
+    **dict.fromkeys((
+        "load_browser_item", "load_instrument_or_effect", "get_browser_tree",
+        "get_browser_items_at_path", "get_plugins_list", "get_third_party_plugins",
+    ), 30.0),
+}
+
+# Canonical interned instance of every known command name, so names built at
+# runtime hash and compare against the command sets by identity
+_COMMAND_NAMES = {name: sys.intern(name) for name in _MODIFYING_COMMANDS | _READONLY_COMMANDS}
+
+# Shared params for commands sent without any; never mutated
+_EMPTY_PARAMS: Dict[str, Any] = {}
+
+class _AbletonProtocol(asyncio.BufferedProtocol):
+    """Reads length-prefixed frames straight into one reusable receive buffer"""
+
+    def __init__(self):
+        self._recv_buf = bytearray(65536)
+        self._recv_len = 0
+        # Response waiters by request id, in the order the requests were written:
+        # [future, timeout, deadline timer or None until the request is at the front]
+        self._waiters: Dict[int, list] = {}
+        self._closed = asyncio.get_running_loop().create_future()
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        # Make room for at least the rest of the frame being received, doubling
+        # the buffer so large responses need only a handful of reallocations
+        needed = self._recv_len + max(self._pending_frame_bytes(), 4096)
+        if needed > len(self._recv_buf):
+            new_size = len(self._recv_buf)
+            while new_size < needed:
+                new_size *= 2
+            self._recv_buf.extend(bytes(new_size - len(self._recv_buf)))
+        return memoryview(self._recv_buf)[self._recv_len:]
+
+    def buffer_updated(self, nbytes):
+        self._recv_len += nbytes
+        header_size = _FRAME_HEADER.size
+        offset = 0
+        while self._recv_len - offset >= header_size:
+            length, request_id = _FRAME_HEADER.unpack_from(self._recv_buf, offset)
+            end = offset + header_size + length
+            if end > self._recv_len:
+                break
+            offset = end
+            entry = self._waiters.pop(request_id, None)
+            if entry is None:
+                # Most likely the reply to a request that already timed out
+                logger.warning("Dropping unexpected %s byte response from Ableton", length)
+                continue
+            waiter, _, timer = entry
+            if timer is not None:
+                timer.cancel()
+            if not waiter.done():
+                # The only copy of the payload: out of the receive buffer into the result
+                waiter.set_result(bytes(memoryview(self._recv_buf)[end - length:end]))
+            self._arm_next()
+
+        if offset:
+            # Move any partial frame to the front; same-size slice assignment never
+            # resizes the buffer, which the event loop may still be viewing
+            remaining = self._recv_len - offset
+            self._recv_buf[:remaining] = self._recv_buf[offset:self._recv_len]
+            self._recv_len = remaining
+
+    def _pending_frame_bytes(self) -> int:
+        """Number of bytes still missing from the frame at the front of the buffer"""
+        header_size = _FRAME_HEADER.size
+        if self._recv_len < header_size:
+            return header_size - self._recv_len
+        length, _ = _FRAME_HEADER.unpack_from(self._recv_buf, 0)
+        return header_size + length - self._recv_len
+
+    def expect_response(self, request_id: int, timeout: float) -> asyncio.Future:
+        """
+        Register interest in the response to request_id.
+
+        The Remote Script handles a connection's requests one at a time, so a
+        request's timeout seconds only start counting once every request written
+        before it has been answered (or has timed out).
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        if self._closed.done():
+            waiter.set_exception(ConnectionError("Connection to Ableton is closed"))
+        else:
+            self._waiters[request_id] = [waiter, timeout, None]
+            if len(self._waiters) == 1:
+                self._arm_next()
+        return waiter
+
+    def _arm_next(self):
+        """Start the deadline of the oldest unanswered request, if it isn't running yet"""
+        for request_id, entry in self._waiters.items():
+            if entry[2] is None:
+                # A single timer per request, cancelled as soon as the frame arrives
+                entry[2] = asyncio.get_running_loop().call_later(entry[1], self._expire, request_id)
+            return
+
+    def _expire(self, request_id: int):
+        """Fail a response waiter whose deadline has passed"""
+        entry = self._waiters.pop(request_id, None)
+        if entry is not None and not entry[0].done():
+            entry[0].set_exception(asyncio.TimeoutError())
+        self._arm_next()
+
+    def in_flight(self) -> int:
+        return len(self._waiters)
+
+    def is_closed(self) -> bool:
+        return self._closed.done()
+
+    async def wait_closed(self):
+        await self._closed
+
+    def connection_lost(self, exc):
+        error = exc or ConnectionError("Connection closed by Ableton")
+        waiters, self._waiters = self._waiters, {}
+        for waiter, _, timer in waiters.values():
+            if timer is not None:
+                timer.cancel()
+            if not waiter.done():
+                waiter.set_exception(error)
+        if not self._closed.done():
+            self._closed.set_result(None)
+
 @dataclass
 class AbletonConnection:
     socket_path: str
-    sock: socket.socket = None
-
-    def connect(self) -> bool:
+    transport: Optional[asyncio.Transport] = None
+    protocol: Optional[_AbletonProtocol] = None
+    # Id of the most recent request; responses are matched to requests by id
+    _request_id: int = field(default=0, repr=False)
+    # Command envelope reused by every send_command call on this connection
+    _command: Dict[str, Any] = field(default_factory=lambda: {"type": None, "params": None}, repr=False)
+    # Keeps concurrent senders from reconnecting the same connection twice
+    _connect_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    async def connect(self) -> bool:
         """Connect to the Ableton Remote Script Unix domain socket server"""
-        if self.sock:
+        async with self._connect_lock:
+            return await self._connect()
+
+    async def _connect(self) -> bool:
+        if self.transport:
             return True
 
         try:
-            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self.sock.connect(self.socket_path)
-            logger.info(f"Connected to Ableton at {self.socket_path}")
+            loop = asyncio.get_running_loop()
+            self.transport, self.protocol = await loop.create_unix_connection(
+                _AbletonProtocol, self.socket_path)
+            logger.info("Connected to Ableton at %s", self.socket_path)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to Ableton: {str(e)}")
-            self.sock = None
+            logger.error("Failed to connect to Ableton: %s", e)
+            self.transport = None
+            self.protocol = None
             return False
     
-    def disconnect(self):
+    async def disconnect(self):
         """Disconnect from the Ableton Remote Script"""
-        if self.sock:
+        if self.transport:
+            protocol = self.protocol
+            self._drop()
             try:
-                self.sock.close()
+                await protocol.wait_closed()
             except Exception as e:
-                logger.error(f"Error disconnecting from Ableton: {str(e)}")
-            finally:
-                self.sock = None
-
-    def receive_full_response(self, sock, buffer_size=8192):
-        """Receive the complete response, potentially in multiple chunks"""
-        chunks = []
-        sock.settimeout(15.0)  # Increased timeout for operations that might take longer
-        
-        try:
-            while True:
-                try:
-                    chunk = sock.recv(buffer_size)
-                    if not chunk:
-                        if not chunks:
-                            raise Exception("Connection closed before receiving any data")
-                        break
-                    
-                    chunks.append(chunk)
-                    
-                    # Check if we've received a complete JSON object
-                    try:
-                        data = b''.join(chunks)
-                        json.loads(data.decode('utf-8'))
-                        logger.info(f"Received complete response ({len(data)} bytes)")
-                        return data
-                    except json.JSONDecodeError:
-                        # Incomplete JSON, continue receiving
-                        continue
-                except socket.timeout:
-                    logger.warning("Socket timeout during chunked receive")
-                    break
-                except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-                    logger.error(f"Socket connection error during receive: {str(e)}")
-                    raise
-        except Exception as e:
-            logger.error(f"Error during receive: {str(e)}")
-            raise
-            
-        # If we get here, we either timed out or broke out of the loop
-        if chunks:
-            data = b''.join(chunks)
-            logger.info(f"Returning data after receive completion ({len(data)} bytes)")
-            try:
-                json.loads(data.decode('utf-8'))
-                return data
-            except json.JSONDecodeError:
-                raise Exception("Incomplete JSON response received")
-        else:
-            raise Exception("No data received")
-
-    def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send a command to Ableton and return the response"""
-        if not self.sock and not self.connect():
-            raise ConnectionError("Not connected to Ableton")
-        
-        command = {
-            "type": command_type,
-            "params": params or {}
-        }
+                logger.error("Error disconnecting from Ableton: %s", e)
+
+    def _drop(self):
+        """Close the stream without waiting, e.g. after it went out of sync"""
+        if self.transport:
+            self.transport.close()
+        self.transport = None
+        self.protocol = None
+
+    def in_flight(self) -> int:
+        """Number of requests on this connection still waiting for a response"""
+        return self.protocol.in_flight() if self.protocol else 0
+
+    def is_alive(self) -> bool:
+        """Check whether the stream is still usable without a round trip to Ableton"""
+        # The event loop watches the socket for us: a peer hang-up or socket error
+        # closes the protocol, without any I/O here
+        return (self.transport is not None
+                and not self.transport.is_closing()
+                and not self.protocol.is_closed())
+
+    async def send_command(self, command_type: str, params: Dict[str, Any] = None,
+                           raw: bool = False) -> Union[Dict[str, Any], bytes]:
+        """
+        Send a command to Ableton and return the response.
+
+        With raw=True the result is returned as undecoded JSON bytes, which lets
+        read-only tools pass large payloads through without parsing them.
+        """
+        # Fill in the reusable envelope and serialize it right away; nothing awaits
+        # in between, so concurrent callers never see each other's values
+        command_type = _COMMAND_NAMES.get(command_type, command_type)
+        command = self._command
+        command["type"] = command_type
+        command["params"] = params if params else _EMPTY_PARAMS
+        payload = _dumps(command)
         
         # Check if this is a state-modifying command
-        is_modifying_command = command_type in [
-            "create_midi_track", "create_audio_track", "set_track_name",
-            "create_clip", "add_notes_to_clip", "add_new_notes_to_clip", "set_clip_name",
-            "remove_notes_from_clip", "modify_notes_in_clip", "select_notes_from_clip",
-            "set_track_volume", "set_track_pan", "set_track_mute", "set_track_solo", "set_track_arm",
-            "delete_track", "duplicate_track", "delete_clip", "duplicate_clip",
-            "set_clip_loop", "set_clip_color", "add_automation_point", "clear_automation",
-            "create_scene", "delete_scene", "fire_scene",
-            "set_loop_start", "set_loop_end", "set_playback_position", "set_metronome",
-            "quantize_notes", "transpose_notes",
-            "set_tempo", "fire_clip", "stop_clip", "set_device_parameter", "set_device_parameters",
-            "start_playback", "stop_playback", "load_instrument_or_effect"
-        ]
+        is_modifying_command = command_type in _MODIFYING_COMMANDS
+        
+        # Set timeout based on the expected cost of the command
+        timeout = _TIMEOUTS.get(command_type, 15.0 if is_modifying_command else 10.0)
         
         try:
-            logger.info(f"Sending command: {command_type} with params: {params}")
+            if not self.transport and not await self.connect():
+                raise ConnectionError("Not connected to Ableton")
             
-            # Send the command
-            self.sock.sendall(json.dumps(command).encode('utf-8'))
-            logger.info(f"Command sent, waiting for response...")
+            logger.info("Sending command: %s with params: %s", command_type, params)
             
-            # For state-modifying commands, add a small delay to give Ableton time to process
-            if is_modifying_command:
-                import time
-                time.sleep(0.1)  # 100ms delay
-            
-            # Set timeout based on command type
-            timeout = 15.0 if is_modifying_command else 10.0
-            self.sock.settimeout(timeout)
+            # Send the command; other requests may already be in flight on this stream
+            self._request_id = request_id = (self._request_id + 1) & 0xFFFFFFFF
+            response_future = self.protocol.expect_response(request_id, timeout)
+            # Hand header and body over together without concatenating them; the
+            # transport can gather both into one sendmsg() call
+            self.transport.writelines((_FRAME_HEADER.pack(len(payload), request_id), payload))
+            logger.info("Command sent, waiting for response...")
             
             # Receive the response
-            response_data = self.receive_full_response(self.sock)
-            logger.info(f"Received {len(response_data)} bytes of data")
-            
-            # Parse the response
-            response = json.loads(response_data.decode('utf-8'))
-            logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
+            response_data = await response_future
+            logger.info("Received %s bytes of data", len(response_data))
             
-            if response.get("status") == "error":
-                logger.error(f"Ableton error: {response.get('message')}")
-                raise Exception(response.get("message", "Unknown error from Ableton"))
+            if raw and response_data.startswith(_RAW_RESULT_PREFIX):
+                # Strip the envelope; the remainder is the result JSON plus a closing brace
+                return response_data[len(_RAW_RESULT_PREFIX):-1]
             
-            # For state-modifying commands, add another small delay after receiving response
-            if is_modifying_command:
-                import time
-                time.sleep(0.1)  # 100ms delay
-            
-            return response.get("result", {})
-        except socket.timeout:
+            # Parse the response
+            response = _loads(response_data)
+            logger.info("Response parsed, status: %s", response.get('status', 'unknown'))
+        except asyncio.TimeoutError:
+            # Responses carry their request id, so a late reply can't be mistaken
+            # for another one and the connection stays usable
             logger.error("Socket timeout while waiting for response from Ableton")
-            self.sock = None
             raise Exception("Timeout waiting for Ableton response")
-        except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-            logger.error(f"Socket connection error: {str(e)}")
-            self.sock = None
+        except ConnectionError as e:
+            logger.error("Socket connection error: %s", e)
+            self._drop()
             raise Exception(f"Connection to Ableton lost: {str(e)}")
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON response from Ableton: {str(e)}")
+            logger.error("Invalid JSON response from Ableton: %s", e)
             if 'response_data' in locals() and response_data:
-                logger.error(f"Raw response (first 200 bytes): {response_data[:200]}")
-            self.sock = None
+                logger.error("Raw response (first 200 bytes): %s", response_data[:200])
+            self._drop()
             raise Exception(f"Invalid response from Ableton: {str(e)}")
         except Exception as e:
-            logger.error(f"Error communicating with Ableton: {str(e)}")
-            self.sock = None
+            logger.error("Error communicating with Ableton: %s", e)
+            self._drop()
             raise Exception(f"Communication error with Ableton: {str(e)}")
+        
+        if response.get("status") == "error":
+            # Only this command failed; other requests on the stream are unaffected
+            logger.error("Ableton error: %s", response.get('message'))
+            raise Exception(f"Communication error with Ableton: {response.get('message', 'Unknown error from Ableton')}")
+        
+        if raw:
+            return _dumps(response.get("result", {}))
+        return response.get("result", {})
+
+    async def send_batch(self, commands: List[tuple]) -> List[Any]:
+        """
+        Send several (command_type, params) commands, writing every request
+        before waiting for any response.
+
+        The Remote Script handles one connection's requests in order. Returns one
+        outcome per command: its result or the Exception it raised.
+        """
+        await self.connect()
+        # Each send_command writes its request before its first await, so the
+        # tasks put all requests on the stream back to back, in order
+        return await asyncio.gather(*(self.send_command(command_type, params)
+                                      for command_type, params in commands),
+                                    return_exceptions=True)
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
@@ -174,26 +410,22 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         logger.info("AbletonMCP server starting up")
         
         try:
-            ableton = get_ableton_connection()
+            ableton = await get_ableton_connection()
+            # Open the connection up front so a missing Remote Script shows early
+            await ableton.connection()
             logger.info("Successfully connected to Ableton on startup")
         except Exception as e:
-            logger.warning(f"Could not connect to Ableton on startup: {str(e)}")
+            logger.warning("Could not connect to Ableton on startup: %s", e)
             logger.warning("Make sure the Ableton Remote Script is running")
         
         yield {}
     finally:
-        global _ableton_connection
-        if _ableton_connection:
-            logger.info("Disconnecting from Ableton on shutdown")
-            _ableton_connection.disconnect()
-            _ableton_connection = None
+        logger.info("Disconnecting from Ableton on shutdown")
+        await _ableton_client.close()
         logger.info("AbletonMCP server shut down")
 
-# Create the MCP server with lifespan support and default instructions
-mcp = FastMCP(
-    "AbletonMCP",
-    lifespan=server_lifespan,
-    instructions="""You are an expert Ableton Live music producer and audio engineer assistant. You have deep knowledge of:
+# Prompt text shared by the server instructions and the prompt endpoints
+_PRODUCER_PROMPT = """You are an expert Ableton Live music producer and audio engineer assistant. You have deep knowledge of:
 
 - Music theory, composition, and arrangement
 - MIDI programming and sequencing
@@ -211,73 +443,408 @@ When working with Ableton:
 7. Consider the genre and style when suggesting instruments, effects, and production techniques
 
 Be creative, practical, and focused on helping users create great-sounding music in Ableton Live."""
+
+_MIDI_PROGRAMMER_PROMPT = """You are a MIDI programming specialist for Ableton Live. Focus on:
+
+- Creating musically interesting note patterns
+- Using appropriate note velocities and timing
+- Understanding scales, chords, and progressions
+- Programming drums with realistic velocity and timing variations
+- Creating melodies and basslines that work well together
+
+Always consider the musical context and genre when programming MIDI."""
+
+# Create the MCP server with lifespan support and default instructions
+mcp = FastMCP(
+    "AbletonMCP",
+    lifespan=server_lifespan,
+    instructions=_PRODUCER_PROMPT
 )
 
-# Global connection for resources
-_ableton_connection = None
+class AbletonClient:
+    """
+    The server's persistent connection to the Ableton Remote Script.
 
-def get_ableton_connection():
-    """Get or create a persistent Ableton connection"""
-    global _ableton_connection
-    
-    if _ableton_connection is not None:
-        try:
-            # Test the connection with a simple ping
-            # We'll try to send an empty message, which should fail if the connection is dead
-            # but won't affect Ableton if it's alive
-            _ableton_connection.sock.settimeout(1.0)
-            _ableton_connection.sock.sendall(b'')
-            return _ableton_connection
-        except Exception as e:
-            logger.warning(f"Existing connection is no longer valid: {str(e)}")
-            try:
-                _ableton_connection.disconnect()
-            except:
-                pass
-            _ableton_connection = None
-    
-    # Connection doesn't exist or is invalid, create a new one
-    if _ableton_connection is None:
+    The connection is opened lazily, pipelines any number of requests and is
+    replaced when it dies. Only one is kept: the Remote Script serves each
+    connection on its own thread and runs read commands there, off Live's main
+    thread, so a second connection would let two threads read the Live API at once.
+    """
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self._connection: Optional[AbletonConnection] = None
+        # Keeps concurrent callers from opening a replacement connection twice
+        self._open_lock = asyncio.Lock()
+        # Fire-and-forget commands, sent one at a time in the order they were queued
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.last_async_error: Optional[Dict[str, Any]] = None
+
+    async def _open(self) -> AbletonConnection:
+        """Open and validate a new connection, retrying a few times"""
         # Try to connect up to 3 times with a short delay between attempts
         max_attempts = 3
-        socket_path = "/tmp/ableton_mcp.sock"
         for attempt in range(1, max_attempts + 1):
+            connection = AbletonConnection(socket_path=self.socket_path)
             try:
-                logger.info(f"Connecting to Ableton (attempt {attempt}/{max_attempts})...")
-                _ableton_connection = AbletonConnection(socket_path=socket_path)
-                if _ableton_connection.connect():
+                logger.info("Connecting to Ableton (attempt %s/%s)...", attempt, max_attempts)
+                if await connection.connect():
                     logger.info("Created new persistent connection to Ableton")
 
                     # Validate connection with a simple command
                     try:
-                        # Get session info as a test
-                        _ableton_connection.send_command("get_session_info")
+                        # Get session info as a test; the result is discarded, so skip decoding it
+                        await connection.send_command("get_session_info", raw=True)
                         logger.info("Connection validated successfully")
-                        return _ableton_connection
+                        return connection
                     except Exception as e:
-                        logger.error(f"Connection validation failed: {str(e)}")
-                        _ableton_connection.disconnect()
-                        _ableton_connection = None
+                        logger.error("Connection validation failed: %s", e)
+                        await connection.disconnect()
                         # Continue to next attempt
-                else:
-                    _ableton_connection = None
             except Exception as e:
-                logger.error(f"Connection attempt {attempt} failed: {str(e)}")
-                if _ableton_connection:
-                    _ableton_connection.disconnect()
-                    _ableton_connection = None
+                logger.error("Connection attempt %s failed: %s", attempt, e)
+                await connection.disconnect()
 
             # Wait before trying again, but only if we have more attempts left
             if attempt < max_attempts:
-                import time
-                time.sleep(1.0)
+                await asyncio.sleep(1.0)
 
         # If we get here, all connection attempts failed
-        if _ableton_connection is None:
-            logger.error("Failed to connect to Ableton after multiple attempts")
-            raise Exception("Could not connect to Ableton. Make sure the Remote Script is running.")
-    
-    return _ableton_connection
+        logger.error("Failed to connect to Ableton after multiple attempts")
+        raise Exception("Could not connect to Ableton. Make sure the Remote Script is running.")
+
+    async def connection(self) -> AbletonConnection:
+        """Return the open connection, opening or replacing it first if needed"""
+        connection = self._connection
+        if connection is not None and connection.is_alive():
+            return connection
+
+        async with self._open_lock:
+            connection = self._connection
+            if connection is not None and connection.is_alive():
+                # Another caller reopened it while we waited for the lock
+                return connection
+            if connection is not None:
+                logger.warning("Existing connection is no longer valid")
+                await connection.disconnect()
+                self._connection = None
+            connection = self._connection = await self._open()
+            return connection
+
+    async def send_command(self, command_type: str, params: Dict[str, Any] = None,
+                           raw: bool = False) -> Union[Dict[str, Any], bytes]:
+        """Send a command and return the response, after every command queued before it"""
+        await self._join_queued()
+        return await self._send_command(command_type, params, raw)
+
+    async def _send_command(self, command_type: str, params: Dict[str, Any] = None,
+                            raw: bool = False) -> Union[Dict[str, Any], bytes]:
+        if command_type not in _READONLY_COMMANDS:
+            _invalidate_parameter_caches(command_type)
+        connection = await self.connection()
+        return await connection.send_command(command_type, params, raw=raw)
+
+    async def send_batch(self, commands: List[tuple]) -> List[Any]:
+        """Pipeline (command_type, params) commands, see AbletonConnection.send_batch"""
+        await self._join_queued()
+        for command_type, _ in commands:
+            if command_type not in _READONLY_COMMANDS:
+                _invalidate_parameter_caches(command_type)
+        connection = await self.connection()
+        return await connection.send_batch(commands)
+
+    async def _join_queued(self):
+        """
+        Wait until every queued fire-and-forget command has been applied.
+
+        A command sent directly would otherwise overtake queued ones, e.g. a
+        delete_track ahead of pending mixer sets that then land on whichever
+        track moved into the deleted one's index.
+        """
+        if self._queue is not None:
+            # Returns at once when the queue is already drained
+            await self._queue.join()
+
+    def send_command_nowait(self, command_type: str, params: Dict[str, Any] = None):
+        """
+        Queue a command and return without waiting for Ableton's reply.
+
+        Queued commands are sent in the order they were queued, and all of them
+        before any command sent afterwards with send_command or send_batch. A
+        failure is recorded in last_async_error instead of being raised.
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._drain(self._queue))
+        self._queue.put_nowait((command_type, params))
+
+    async def _drain(self, queue: asyncio.Queue):
+        """Send queued fire-and-forget commands one at a time"""
+        while True:
+            command_type, params = await queue.get()
+            try:
+                # Not send_command, which would wait for this very queue
+                await self._send_command(command_type, params)
+            except Exception as e:
+                logger.error("Queued %s failed: %s", command_type, e)
+                self.last_async_error = {"command": command_type, "params": params, "error": str(e)}
+            finally:
+                queue.task_done()
+
+    async def close(self):
+        """Flush queued commands and disconnect"""
+        if self._queue is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            self._queue, self._worker = None, None
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.disconnect()
+
+
+# Shared client used by every tool
+_ableton_client = AbletonClient("/tmp/ableton_mcp.sock")
+
+async def get_ableton_connection() -> AbletonClient:
+    """Get the shared Ableton client"""
+    return _ableton_client
+
+
+class _Coalescer:
+    """
+    Merge calls with the same key that arrive close together into one round-trip.
+
+    The first call for a key schedules a flush after the coalescing window, which
+    passes every entry that arrived meanwhile to send(key, entries). send returns
+    one outcome per entry, either that caller's result or an Exception to raise
+    for it. The flush runs in its own task, so cancelling any caller, the first
+    one included, never strands the others; a caller cancelled before the flush
+    has its entry dropped. A window of 0 disables merging: every call is sent
+    on its own.
+    """
+
+    def __init__(self, window: float, send: Callable[[tuple, List[Any]], Any]):
+        self.window = window
+        self._send = send
+        self._pending: Dict[tuple, List[tuple]] = {}
+        # Running flushes, referenced so they aren't garbage collected midway
+        self._flushes: set = set()
+
+    async def submit(self, key: tuple, entry: Any) -> Any:
+        if self.window <= 0:
+            outcome = (await self._send(key, [entry]))[0]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self.window, self._start_flush, key)
+        batch.append((entry, future))
+        return await future
+
+    def _start_flush(self, key: tuple):
+        task = asyncio.get_running_loop().create_task(self._flush(key))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, key: tuple):
+        # Callers cancelled while waiting for the window have given up on their entry
+        batch = [(entry, future) for entry, future in self._pending.pop(key) if not future.done()]
+        if not batch:
+            return
+        try:
+            outcomes = await self._send(key, [entry for entry, _ in batch])
+            if len(outcomes) != len(batch):
+                raise Exception(f"Expected {len(batch)} results from Ableton, got {len(outcomes)}")
+        except Exception as e:
+            outcomes = [e] * len(batch)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        for (_, future), outcome in zip(batch, outcomes):
+            # A caller cancelled during the send no longer waits for its outcome
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+async def _send_parameter_batch(key: tuple, entries: List[Dict[str, Any]]) -> List[Any]:
+    """Apply single-parameter sets for one device as one set_device_parameters command"""
+    ableton = await get_ableton_connection()
+    result = await ableton.send_command("set_device_parameters", {
+        "track_index": key[0],
+        "device_index": key[1],
+        **_parameter_columns(key, entries)
+    })
+    device_name = result.get("device_name", "unknown")
+    outcomes = []
+    for entry, row in zip(entries, result.get("results", [])):
+        if row.get("success"):
+            _remember_parameter_index(key, entry, row)
+            row["device_name"] = device_name
+            outcomes.append(row)
+        else:
+            outcomes.append(Exception(row.get("error", "unknown error")))
+    return outcomes
+
+
+async def _send_note_removals(key: tuple, entries: List[Dict[str, Any]]) -> List[Any]:
+    """Apply several note removals on one clip as one remove_notes_from_clip command"""
+    note_ids = set()
+    ranges = []
+    for entry in entries:
+        if entry.get("note_ids"):
+            note_ids.update(entry["note_ids"])
+        else:
+            ranges.append(entry)
+    ableton = await get_ableton_connection()
+    result = await ableton.send_command("remove_notes_from_clip", {
+        "track_index": key[0],
+        "clip_index": key[1],
+        "note_ids": sorted(note_ids),
+        "ranges": ranges
+    })
+    # Hand each caller the result it would have got from its own command
+    removed_ranges = iter(result.get("removed_ranges", []))
+    return [{"removed_count": len(entry["note_ids"])} if entry.get("note_ids")
+            else {"removed_range": next(removed_ranges, {})}
+            for entry in entries]
+
+
+async def _send_note_modifications(key: tuple, entries: List[List[Dict[str, Any]]]) -> List[Any]:
+    """Apply several modification lists on one clip as one modify_notes_in_clip command"""
+    ableton = await get_ableton_connection()
+    await ableton.send_command("modify_notes_in_clip", {
+        "track_index": key[0],
+        "clip_index": key[1],
+        "modifications": [mod for modifications in entries for mod in modifications]
+    })
+    return [{"modified_count": len(modifications)} for modifications in entries]
+
+
+# Parameter listings by (track, device[, chain, chain device]). Values can move
+# under automation, so listings only live briefly and any state change drops them
+_PARAM_CACHE_TTL = 2.0
+_param_cache: Dict[tuple, tuple] = {}
+_param_cache_generation = 0
+# Parameter name -> index by device. Only used as a hint: the Remote Script checks
+# the name at that index before trusting it, so a stale entry costs nothing
+_param_index_cache: Dict[tuple, Dict[str, int]] = {}
+
+def _invalidate_parameter_caches(command_type: str):
+    """Drop cached parameter data that a state-changing command may have outdated"""
+    global _param_cache_generation
+    _param_cache_generation += 1
+    _param_cache.clear()
+    if command_type in _STRUCTURAL_COMMANDS:
+        _param_index_cache.clear()
+
+async def _get_parameters(command_type: str, params: Dict[str, Any],
+                          index_key: Optional[tuple] = None) -> Dict[str, Any]:
+    """Fetch a page of a device's parameter listing, reusing a recent one when possible"""
+    key = tuple(params.values())
+    now = time.monotonic()
+    cached = _param_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    generation = _param_cache_generation
+    ableton = await get_ableton_connection()
+    result = await ableton.send_command(command_type, params)
+    # Don't store a listing that a concurrent state change may already have outdated
+    if generation == _param_cache_generation:
+        _param_cache[key] = (now + _PARAM_CACHE_TTL, result)
+    if index_key is not None:
+        # A name can repeat (plugins often have two "Gain"s); lookups by name
+        # mean its first occurrence, so a later one must not replace it
+        names = _param_index_cache.setdefault(index_key, {})
+        for p in result.get("parameters", ()):
+            names.setdefault(p["name"], p["index"])
+    return result
+
+def _remember_parameter_index(key: tuple, entry: Dict[str, Any], row: Dict[str, Any]):
+    """
+    Record the name -> index pair that a parameter set reported back.
+
+    Only sets addressed by name count: the Remote Script resolves those to the
+    first parameter with that name, while a set by index may have hit a later
+    parameter sharing the name.
+    """
+    if entry.get("parameter_index") is None and "parameter_name" in row and "parameter_index" in row:
+        _param_index_cache.setdefault(key, {})[row["parameter_name"]] = row["parameter_index"]
+
+def _parameter_columns(key: tuple, entries: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Lay out parameter set entries as parallel name/index/value lists for the wire.
+
+    Three flat lists serialize faster and smaller than a list of small dicts. A
+    names or indices list that would hold only nulls is left out.
+    """
+    hints = _param_index_cache.get(key, {})
+    names = [entry.get("parameter_name") for entry in entries]
+    indices = [entry.get("parameter_index") if entry.get("parameter_index") is not None else hints.get(name)
+               for entry, name in zip(entries, names)]
+    columns: Dict[str, List[Any]] = {"values": [entry.get("value") for entry in entries]}
+    if any(name is not None for name in names):
+        columns["names"] = names
+    if any(index is not None for index in indices):
+        columns["indices"] = indices
+    return columns
+
+def _with_index_hint(key: tuple, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Add a cached parameter_index hint to an entry that names its parameter"""
+    if entry.get("parameter_name") is None or entry.get("parameter_index") is not None:
+        return entry
+    index = _param_index_cache.get(key, {}).get(entry["parameter_name"])
+    if index is None:
+        return entry
+    return {**entry, "parameter_index": index}
+
+
+async def _send_automation_points(key: tuple, entries: List[Dict[str, Any]]) -> List[Any]:
+    """Add several automation points on one parameter as one add_automation_points command"""
+    ableton = await get_ableton_connection()
+    await ableton.send_command("add_automation_points", {
+        "track_index": key[0],
+        "device_index": key[1],
+        "parameter_index": key[2],
+        "points": entries
+    })
+    return [{"added": True, "time": entry["time"], "value": entry["value"]} for entry in entries]
+
+
+# Coalescing window for device parameter sets, note edits and automation points,
+# in milliseconds (0 disables it)
+_COALESCE_WINDOW = float(os.environ.get("ABLETON_COALESCE_MS", "5")) / 1000.0
+_parameter_coalescer = _Coalescer(_COALESCE_WINDOW, _send_parameter_batch)
+_note_removal_coalescer = _Coalescer(_COALESCE_WINDOW, _send_note_removals)
+_note_modification_coalescer = _Coalescer(_COALESCE_WINDOW, _send_note_modifications)
+_automation_coalescer = _Coalescer(_COALESCE_WINDOW, _send_automation_points)
+
+
+# Tool functions by name, so run_batch can call them without MCP framing
+_TOOL_REGISTRY: Dict[str, Callable[..., Any]] = {}
+# Tools with a wait flag, which otherwise only queue their command
+_WAITABLE_TOOLS = set()
+
+def _tool(*args, **kwargs):
+    """Register a function both as an MCP tool and in _TOOL_REGISTRY"""
+    register = mcp.tool(*args, **kwargs)
+
+    def decorator(fn):
+        _TOOL_REGISTRY[fn.__name__] = fn
+        if "wait" in inspect.signature(fn).parameters:
+            _WAITABLE_TOOLS.add(fn.__name__)
+        return register(fn)
+    return decorator
 
 
 # Prompts for specialized LLM behavior
@@ -285,85 +852,80 @@ def get_ableton_connection():
 @mcp.prompt()
 def ableton_music_producer(ctx: Context) -> str:
     """System prompt for music production with Ableton Live"""
-    return """You are an expert Ableton Live music producer and audio engineer. You have deep knowledge of:
-
-- Music theory, composition, and arrangement
-- MIDI programming and sequencing
-- Sound design and synthesis
-- Audio effects and mixing techniques
-- Ableton Live's workflow and best practices
-
-When working with Ableton:
-1. Always get session info first to understand the current project state
-2. Use descriptive track and clip names for organization
-3. Consider musical context (key, tempo, genre) when making suggestions
-4. Explain your creative decisions in musical terms
-5. Think about the overall arrangement and how parts work together
-
-Be creative, practical, and focused on helping create great-sounding music."""
+    return _PRODUCER_PROMPT
 
 @mcp.prompt()
 def ableton_midi_programmer(ctx: Context) -> str:
     """System prompt specialized for MIDI programming"""
-    return """You are a MIDI programming specialist for Ableton Live. Focus on:
-
-- Creating musically interesting note patterns
-- Using appropriate note velocities and timing
-- Understanding scales, chords, and progressions
-- Programming drums with realistic velocity and timing variations
-- Creating melodies and basslines that work well together
-
-Always consider the musical context and genre when programming MIDI."""
+    return _MIDI_PROGRAMMER_PROMPT
 
 
 # Core Tool endpoints
 
-@mcp.tool()
-def get_session_info(ctx: Context) -> str:
-    """Get detailed information about the current Ableton session"""
+async def _run_command(command_type: str, params: Dict[str, Any] = None,
+                       fmt: Optional[Callable[[Dict[str, Any]], str]] = None,
+                       action: Optional[str] = None, raw: bool = False,
+                       wait: bool = True, message: Optional[str] = None,
+                       compact: bool = False) -> str:
+    """
+    Send a command to Ableton and turn the outcome into a tool response.
+
+    On success the response is message, when the text doesn't depend on the
+    result, or the result rendered with fmt, or the result as JSON (on one line
+    with compact=True, for short acknowledgements). Failures
+    are logged once and reported as "Error <action>: ..." (or "Error: ..." when
+    no action is given). With wait=False the command is only queued and message
+    is returned right away; failures show up in get_last_async_error.
+    """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_session_info")
-        return json.dumps(result, indent=2)
+        ableton = await get_ableton_connection()
+        if not wait:
+            ableton.send_command_nowait(command_type, params)
+            return message
+        result = await ableton.send_command(command_type, params, raw=raw)
+        if message is not None:
+            return message
+        if fmt is not None:
+            return fmt(result)
+        if raw:
+            return result.decode('utf-8')
+        return _compact_json(result) if compact else _format_json(result)
     except Exception as e:
-        logger.error(f"Error getting session info from Ableton: {str(e)}")
-        return f"Error getting session info: {str(e)}"
+        logger.error("Error %s: %s", action or 'sending ' + command_type, e)
+        if action:
+            return f"Error {action}: {str(e)}"
+        return f"Error: {str(e)}"
+
+@_tool()
+async def get_session_info(ctx: Context) -> str:
+    """Get detailed information about the current Ableton session"""
+    return await _run_command("get_session_info", raw=True, action="getting session info")
 
-@mcp.tool()
-def get_track_info(ctx: Context, track_index: int) -> str:
+@_tool()
+async def get_track_info(ctx: Context, track_index: int) -> str:
     """
     Get detailed information about a specific track in Ableton.
     
     Parameters:
     - track_index: The index of the track to get information about
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_track_info", {"track_index": track_index})
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting track info from Ableton: {str(e)}")
-        return f"Error getting track info: {str(e)}"
+    return await _run_command("get_track_info", {"track_index": track_index}, action="getting track info")
 
-@mcp.tool()
-def create_midi_track(ctx: Context, index: int = -1) -> str:
+@_tool()
+async def create_midi_track(ctx: Context, index: int = -1) -> str:
     """
     Create a new MIDI track in the Ableton session.
     
     Parameters:
     - index: The index to insert the track at (-1 = end of list)
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("create_midi_track", {"index": index})
-        return f"Created new MIDI track: {result.get('name', 'unknown')}"
-    except Exception as e:
-        logger.error(f"Error creating MIDI track: {str(e)}")
-        return f"Error creating MIDI track: {str(e)}"
+    return await _run_command("create_midi_track", {"index": index},
+                              fmt=lambda result: f"Created new MIDI track: {result.get('name', 'unknown')}",
+                              action="creating MIDI track")
 
 
-@mcp.tool()
-def set_track_name(ctx: Context, track_index: int, name: str) -> str:
+@_tool()
+async def set_track_name(ctx: Context, track_index: int, name: str) -> str:
     """
     Set the name of a track.
     
@@ -371,16 +933,12 @@ def set_track_name(ctx: Context, track_index: int, name: str) -> str:
     - track_index: The index of the track to rename
     - name: The new name for the track
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_track_name", {"track_index": track_index, "name": name})
-        return f"Renamed track to: {result.get('name', name)}"
-    except Exception as e:
-        logger.error(f"Error setting track name: {str(e)}")
-        return f"Error setting track name: {str(e)}"
+    return await _run_command("set_track_name", {"track_index": track_index, "name": name},
+                              fmt=lambda result: f"Renamed track to: {result.get('name', name)}",
+                              action="setting track name")
 
-@mcp.tool()
-def create_clip(ctx: Context, track_index: int, clip_index: int, length: float = 4.0) -> str:
+@_tool()
+async def create_clip(ctx: Context, track_index: int, clip_index: int, length: float = 4.0) -> str:
     """
     Create a new MIDI clip in the specified track and clip slot.
     
@@ -389,20 +947,15 @@ def create_clip(ctx: Context, track_index: int, clip_index: int, length: float =
     - clip_index: The index of the clip slot to create the clip in
     - length: The length of the clip in beats (default: 4.0)
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("create_clip", {
-            "track_index": track_index, 
-            "clip_index": clip_index, 
-            "length": length
-        })
-        return f"Created new clip at track {track_index}, slot {clip_index} with length {length} beats"
-    except Exception as e:
-        logger.error(f"Error creating clip: {str(e)}")
-        return f"Error creating clip: {str(e)}"
-
-@mcp.tool()
-def get_notes_from_clip(ctx: Context, track_index: int, clip_index: int) -> str:
+    return await _run_command("create_clip", {
+        "track_index": track_index, 
+        "clip_index": clip_index, 
+        "length": length
+    }, message=f"Created new clip at track {track_index}, slot {clip_index} with length {length} beats",
+       action="creating clip")
+
+@_tool()
+async def get_notes_from_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     """
     Get MIDI notes from a clip using get_notes_extended.
     Returns note data including note IDs and all MIDI properties (MPE, probability, velocity deviation, etc.)
@@ -411,19 +964,13 @@ def get_notes_from_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     - track_index: The index of the track containing the clip
     - clip_index: The index of the clip slot containing the clip
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_notes_from_clip", {
-            "track_index": track_index,
-            "clip_index": clip_index
-        })
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting notes from clip: {str(e)}")
-        return f"Error getting notes from clip: {str(e)}"
+    return await _run_command("get_notes_from_clip", {
+        "track_index": track_index,
+        "clip_index": clip_index
+    }, raw=True, action="getting notes from clip")
 
-@mcp.tool()
-def add_notes_to_clip(
+@_tool()
+async def add_notes_to_clip(
     ctx: Context,
     track_index: int,
     clip_index: int,
@@ -438,20 +985,15 @@ def add_notes_to_clip(
     - clip_index: The index of the clip slot containing the clip
     - notes: List of note dictionaries, each with pitch, start_time, duration, velocity, and mute
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("add_notes_to_clip", {
-            "track_index": track_index,
-            "clip_index": clip_index,
-            "notes": notes
-        })
-        return f"Added {len(notes)} notes to clip at track {track_index}, slot {clip_index} (replaced existing notes)"
-    except Exception as e:
-        logger.error(f"Error adding notes to clip: {str(e)}")
-        return f"Error adding notes to clip: {str(e)}"
-
-@mcp.tool()
-def add_new_notes_to_clip(
+    return await _run_command("add_notes_to_clip", {
+        "track_index": track_index,
+        "clip_index": clip_index,
+        "notes": notes
+    }, message=f"Added {len(notes)} notes to clip at track {track_index}, slot {clip_index} (replaced existing notes)",
+       action="adding notes to clip")
+
+@_tool()
+async def add_new_notes_to_clip(
     ctx: Context,
     track_index: int,
     clip_index: int,
@@ -468,20 +1010,35 @@ def add_new_notes_to_clip(
       * Required: pitch, start_time, duration, velocity
       * Optional: mute, velocity_deviation, release_velocity, probability
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("add_new_notes_to_clip", {
-            "track_index": track_index,
-            "clip_index": clip_index,
-            "notes": notes
-        })
-        return f"Added {len(notes)} new notes to clip at track {track_index}, slot {clip_index} (kept existing notes)"
-    except Exception as e:
-        logger.error(f"Error adding new notes to clip: {str(e)}")
-        return f"Error adding new notes to clip: {str(e)}"
+    return await _run_command("add_new_notes_to_clip", {
+        "track_index": track_index,
+        "clip_index": clip_index,
+        "notes": notes
+    }, message=f"Added {len(notes)} new notes to clip at track {track_index}, slot {clip_index} (kept existing notes)",
+       action="adding new notes to clip")
+
+@_tool()
+async def add_notes_batch(
+    ctx: Context,
+    operations: List[Dict[str, Any]]
+) -> str:
+    """
+    Add new MIDI notes to several clips in one request, as a single undo step.
+    Much faster than calling add_new_notes_to_clip once per clip; existing notes are kept.
+
+    Parameters:
+    - operations: List of dictionaries, each with:
+      * track_index: The index of the track containing the clip
+      * clip_index: The index of the clip slot containing the clip
+      * notes: List of note dictionaries (pitch, start_time, duration, velocity, mute)
+      Example: [{"track_index": 0, "clip_index": 0, "notes": [{"pitch": 36, "start_time": 0.0, "duration": 0.25, "velocity": 110}]}]
+    """
+    return await _run_command("add_notes_batch", {"operations": operations},
+                              fmt=lambda result: f"Added {result.get('note_count', 0)} new notes across {result.get('operation_count', 0)} clips (kept existing notes)",
+                              action="adding notes batch")
 
-@mcp.tool()
-def set_clip_name(ctx: Context, track_index: int, clip_index: int, name: str) -> str:
+@_tool()
+async def set_clip_name(ctx: Context, track_index: int, clip_index: int, name: str) -> str:
     """
     Set the name of a clip.
     
@@ -490,37 +1047,28 @@ def set_clip_name(ctx: Context, track_index: int, clip_index: int, name: str) ->
     - clip_index: The index of the clip slot containing the clip
     - name: The new name for the clip
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_clip_name", {
-            "track_index": track_index,
-            "clip_index": clip_index,
-            "name": name
-        })
-        return f"Renamed clip at track {track_index}, slot {clip_index} to '{name}'"
-    except Exception as e:
-        logger.error(f"Error setting clip name: {str(e)}")
-        return f"Error setting clip name: {str(e)}"
-
-@mcp.tool()
-def set_tempo(ctx: Context, tempo: float) -> str:
+    return await _run_command("set_clip_name", {
+        "track_index": track_index,
+        "clip_index": clip_index,
+        "name": name
+    }, message=f"Renamed clip at track {track_index}, slot {clip_index} to '{name}'",
+       action="setting clip name")
+
+@_tool()
+async def set_tempo(ctx: Context, tempo: float) -> str:
     """
     Set the tempo of the Ableton session.
     
     Parameters:
     - tempo: The new tempo in BPM
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_tempo", {"tempo": tempo})
-        return f"Set tempo to {tempo} BPM"
-    except Exception as e:
-        logger.error(f"Error setting tempo: {str(e)}")
-        return f"Error setting tempo: {str(e)}"
+    return await _run_command("set_tempo", {"tempo": tempo},
+                              message=f"Set tempo to {tempo} BPM",
+                              action="setting tempo")
 
 
-@mcp.tool()
-def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
+@_tool()
+async def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
     """
     Load an instrument or effect onto a track using its URI.
     
@@ -529,8 +1077,8 @@ def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
     - uri: The URI of the instrument or effect to load (e.g., 'query:Synths#Instrument%20Rack:Bass:FileId_5116')
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("load_browser_item", {
+        ableton = await get_ableton_connection()
+        result = await ableton.send_command("load_browser_item", {
             "track_index": track_index,
             "item_uri": uri
         })
@@ -546,11 +1094,11 @@ def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
         else:
             return f"Failed to load instrument with URI '{uri}'"
     except Exception as e:
-        logger.error(f"Error loading instrument by URI: {str(e)}")
+        logger.error("Error loading instrument by URI: %s", e)
         return f"Error loading instrument by URI: {str(e)}"
 
-@mcp.tool()
-def fire_clip(ctx: Context, track_index: int, clip_index: int) -> str:
+@_tool()
+async def fire_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     """
     Start playing a clip.
     
@@ -558,19 +1106,14 @@ def fire_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     - track_index: The index of the track containing the clip
     - clip_index: The index of the clip slot containing the clip
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("fire_clip", {
-            "track_index": track_index,
-            "clip_index": clip_index
-        })
-        return f"Started playing clip at track {track_index}, slot {clip_index}"
-    except Exception as e:
-        logger.error(f"Error firing clip: {str(e)}")
-        return f"Error firing clip: {str(e)}"
-
-@mcp.tool()
-def stop_clip(ctx: Context, track_index: int, clip_index: int) -> str:
+    return await _run_command("fire_clip", {
+        "track_index": track_index,
+        "clip_index": clip_index
+    }, message=f"Started playing clip at track {track_index}, slot {clip_index}",
+       action="firing clip")
+
+@_tool()
+async def stop_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     """
     Stop playing a clip.
     
@@ -578,41 +1121,53 @@ def stop_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     - track_index: The index of the track containing the clip
     - clip_index: The index of the clip slot containing the clip
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("stop_clip", {
-            "track_index": track_index,
-            "clip_index": clip_index
-        })
-        return f"Stopped clip at track {track_index}, slot {clip_index}"
-    except Exception as e:
-        logger.error(f"Error stopping clip: {str(e)}")
-        return f"Error stopping clip: {str(e)}"
+    return await _run_command("stop_clip", {
+        "track_index": track_index,
+        "clip_index": clip_index
+    }, message=f"Stopped clip at track {track_index}, slot {clip_index}", action="stopping clip")
 
-@mcp.tool()
-def start_playback(ctx: Context) -> str:
+@_tool()
+async def start_playback(ctx: Context) -> str:
     """Start playing the Ableton session."""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("start_playback")
-        return "Started playback"
-    except Exception as e:
-        logger.error(f"Error starting playback: {str(e)}")
-        return f"Error starting playback: {str(e)}"
+    return await _run_command("start_playback",
+                              message="Started playback",
+                              action="starting playback")
 
-@mcp.tool()
-def stop_playback(ctx: Context) -> str:
+@_tool()
+async def stop_playback(ctx: Context) -> str:
     """Stop playing the Ableton session."""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("stop_playback")
-        return "Stopped playback"
-    except Exception as e:
-        logger.error(f"Error stopping playback: {str(e)}")
-        return f"Error stopping playback: {str(e)}"
+    return await _run_command("stop_playback",
+                              message="Stopped playback",
+                              action="stopping playback")
+
+# Known browser failures: (substrings that must all appear, log label, message template)
+_BROWSER_ERRORS = (
+    (("Browser is not available",), "Browser is not available in Ableton",
+     "Error: The Ableton browser is not available. Make sure Ableton Live is fully loaded and try again."),
+    (("Could not access Live application",), "Could not access Live application",
+     "Error: Could not access the Ableton Live application. Make sure Ableton Live is running and the Remote Script is loaded."),
+    (("Unknown or unavailable category",), "Invalid browser category",
+     "Error: {error}. Please check the available categories using get_browser_tree."),
+    (("Path part", "not found"), "Path not found",
+     "Error: {error}. Please check the path and try again."),
+)
+
+def _format_browser_error(e: Exception, action: str) -> str:
+    """Log a failed browser command and return an actionable error message"""
+    error_msg = str(e)
+    for needles, label, template in _BROWSER_ERRORS:
+        if all(needle in error_msg for needle in needles):
+            logger.error("%s: %s", label, error_msg)
+            return template.format(error=error_msg)
+
+    logger.error("Error %s: %s", action, error_msg)
+    return f"Error {action}: {error_msg}"
 
-@mcp.tool()
-def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
+# Indentation prefixes for browser tree levels, built once
+_TREE_INDENTS = tuple("  " * depth for depth in range(16))
+
+@_tool()
+async def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
     """
     Get a hierarchical tree of browser categories from Ableton.
     
@@ -620,8 +1175,8 @@ def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
     - category_type: Type of categories to get ('all', 'instruments', 'sounds', 'drums', 'audio_effects', 'midi_effects')
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_browser_tree", {
+        ableton = await get_ableton_connection()
+        result = await ableton.send_command("get_browser_tree", {
             "category_type": category_type
         })
         
@@ -633,49 +1188,37 @@ def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
         
         # Format the tree in a more readable way
         total_folders = result.get("total_folders", 0)
-        formatted_output = f"Browser tree for '{category_type}' (showing {total_folders} folders):\n\n"
+        parts = [f"Browser tree for '{category_type}' (showing {total_folders} folders):\n\n"]
         
-        def format_tree(item, indent=0):
-            output = ""
-            if item:
-                prefix = "  " * indent
-                name = item.get("name", "Unknown")
-                path = item.get("path", "")
-                has_more = item.get("has_more", False)
+        # Walk each category depth-first with an explicit stack, collecting output
+        # pieces in a list that is joined once at the end
+        for category in result.get("categories", []):
+            stack = [(category, 0)]
+            while stack:
+                item, indent = stack.pop()
+                if not item:
+                    continue
                 
                 # Add this item
-                output += f"{prefix}• {name}"
+                prefix = _TREE_INDENTS[indent] if indent < len(_TREE_INDENTS) else "  " * indent
+                parts.append(f"{prefix}• {item.get('name', 'Unknown')}")
+                path = item.get("path", "")
                 if path:
-                    output += f" (path: {path})"
-                if has_more:
-                    output += " [...]"
-                output += "\n"
+                    parts.append(f" (path: {path})")
+                if item.get("has_more", False):
+                    parts.append(" [...]")
+                parts.append("\n")
                 
-                # Add children
-                for child in item.get("children", []):
-                    output += format_tree(child, indent + 1)
-            return output
-        
-        # Format each category
-        for category in result.get("categories", []):
-            formatted_output += format_tree(category)
-            formatted_output += "\n"
+                # Add children, reversed so they pop off the stack in their original order
+                stack.extend((child, indent + 1) for child in reversed(item.get("children", [])))
+            parts.append("\n")
         
-        return formatted_output
+        return "".join(parts)
     except Exception as e:
-        error_msg = str(e)
-        if "Browser is not available" in error_msg:
-            logger.error(f"Browser is not available in Ableton: {error_msg}")
-            return f"Error: The Ableton browser is not available. Make sure Ableton Live is fully loaded and try again."
-        elif "Could not access Live application" in error_msg:
-            logger.error(f"Could not access Live application: {error_msg}")
-            return f"Error: Could not access the Ableton Live application. Make sure Ableton Live is running and the Remote Script is loaded."
-        else:
-            logger.error(f"Error getting browser tree: {error_msg}")
-            return f"Error getting browser tree: {error_msg}"
+        return _format_browser_error(e, "getting browser tree")
 
-@mcp.tool()
-def get_browser_items_at_path(ctx: Context, path: str) -> str:
+@_tool()
+async def get_browser_items_at_path(ctx: Context, path: str) -> str:
     """
     Get browser items at a specific path in Ableton's browser.
     
@@ -684,10 +1227,15 @@ def get_browser_items_at_path(ctx: Context, path: str) -> str:
             where category is one of the available browser categories in Ableton
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_browser_items_at_path", {
+        ableton = await get_ableton_connection()
+        raw_result = await ableton.send_command("get_browser_items_at_path", {
             "path": path
-        })
+        }, raw=True)
+        
+        # Only decode the result when it may carry the available-categories error
+        if b'"available_categories"' not in raw_result:
+            return raw_result.decode('utf-8')
+        result = _loads(raw_result)
         
         # Check if there was an error with available categories
         if "error" in result and "available_categories" in result:
@@ -696,27 +1244,12 @@ def get_browser_items_at_path(ctx: Context, path: str) -> str:
             return (f"Error: {error}\n"
                    f"Available browser categories: {', '.join(available_cats)}")
         
-        return json.dumps(result, indent=2)
+        return _format_json(result)
     except Exception as e:
-        error_msg = str(eN)
-        if "Browser is not available" in error_msg:
-            logger.error(f"Browser is not available in Ableton: {error_msg}")
-            return f"Error: The Ableton browser is not available. Make sure Ableton Live is fully loaded and try again."
-        elif "Could not access Live application" in error_msg:
-            logger.error(f"Could not access Live application: {error_msg}")
-            return f"Error: Could not access the Ableton Live application. Make sure Ableton Live is running and the Remote Script is loaded."
-        elif "Unknown or unavailable category" in error_msg:
-            logger.error(f"Invalid browser category: {error_msg}")
-            return f"Error: {error_msg}. Please check the available categories using get_browser_tree."
-        elif "Path part" in error_msg and "not found" in error_msg:
-            logger.error(f"Path not found: {error_msg}")
-            return f"Error: {error_msg}. Please check the path and try again."
-        else:
-            logger.error(f"Error getting browser items at path: {error_msg}")
-            return f"Error getting browser items at path: {error_msg}"
+        return _format_browser_error(e, "getting browser items at path")
 
-@mcp.tool()
-def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str) -> str:
+@_tool()
+async def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str) -> str:
     """
     Load a drum rack and then load a specific drum kit into it.
     
@@ -726,10 +1259,10 @@ def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str)
     - kit_path: Path to the drum kit inside the browser (e.g., 'drums/acoustic/kit1')
     """
     try:
-        ableton = get_ableton_connection()
+        ableton = await get_ableton_connection()
         
         # Step 1: Load the drum rack
-        result = ableton.send_command("load_browser_item", {
+        result = await ableton.send_command("load_browser_item", {
             "track_index": track_index,
             "item_uri": rack_uri
         })
@@ -738,7 +1271,7 @@ def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str)
             return f"Failed to load drum rack with URI '{rack_uri}'"
         
         # Step 2: Get the drum kit items at the specified path
-        kit_result = ableton.send_command("get_browser_items_at_path", {
+        kit_result = await ableton.send_command("get_browser_items_at_path", {
             "path": kit_path
         })
         
@@ -747,27 +1280,28 @@ def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str)
         
         # Step 3: Find a loadable drum kit
         kit_items = kit_result.get("items", [])
-        loadable_kits = [item for item in kit_items if item.get("is_loadable", False)]
+        kit = next((item for item in kit_items if item.get("is_loadable", False)), None)
         
-        if not loadable_kits:
+        if kit is None:
             return f"Loaded drum rack but no loadable drum kits found at '{kit_path}'"
         
         # Step 4: Load the first loadable kit
-        kit_uri = loadable_kits[0].get("uri")
-        load_result = ableton.send_command("load_browser_item", {
+        kit_uri = kit.get("uri")
+        load_result = await ableton.send_command("load_browser_item", {
             "track_index": track_index,
             "item_uri": kit_uri
         })
         
-        return f"Loaded drum rack and kit '{loadable_kits[0].get('name')}' on track {track_index}"
+        return f"Loaded drum rack and kit '{kit.get('name')}' on track {track_index}"
     except Exception as e:
-        logger.error(f"Error loading drum kit: {str(e)}")
+        logger.error("Error loading drum kit: %s", e)
         return f"Error loading drum kit: {str(e)}"
 
-@mcp.tool()
-def get_device_parameters(ctx: Context, track_index: int, device_index: int) -> str:
+@_tool()
+async def get_device_parameters(ctx: Context, track_index: int, device_index: int,
+                                offset: int = 0, page_size: Optional[int] = None, summary_only: bool = False) -> str:
     """
-    Get all parameters for a device (including 3rd party plugins).
+    Get the parameters for a device (including 3rd party plugins), optionally one page at a time.
 
     This tool works for both Ableton native devices and 3rd party VST/AU/AAX plugins.
     For 3rd party plugins, ALL parameters are returned without filtering.
@@ -775,6 +1309,9 @@ def get_device_parameters(ctx: Context, track_index: int, device_index: int) ->
     Parameters:
     - track_index: The index of the track containing the device
     - device_index: The index of the device on the track
+    - offset: Parameter index to start the page at (default 0)
+    - page_size: Number of parameter indices the page covers (default: all of them from offset on)
+    - summary_only: Return only index and name per parameter, e.g. to look up names
 
     Returns:
     - JSON string with device information including:
@@ -784,25 +1321,27 @@ def get_device_parameters(ctx: Context, track_index: int, device_index: int) ->
       * is_plugin: True if this is a 3rd party plugin (VST/AU/AAX)
       * parameter_count: Number of accessible parameters
       * parameters: Array of parameter objects with index, name, value, min, max
+      * next_offset: Offset of the next page, or null after the last page
 
     Note: For 3rd party plugins with many parameters (e.g., 100+), consider using
     the rack workflow: load plugin into a rack, map desired parameters to macros (0-7),
     then control via macros using set_device_parameter on the rack.
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_device_parameters", {
+        result = await _get_parameters("get_device_parameters", {
             "track_index": track_index,
-            "device_index": device_index
-        })
-
-        return json.dumps(result, indent=2)
+            "device_index": device_index,
+            "offset": offset,
+            "page_size": page_size,
+            "summary_only": summary_only
+        }, index_key=(track_index, device_index))
+        return _format_json(result)
     except Exception as e:
-        logger.error(f"Error getting device parameters: {str(e)}")
+        logger.error("Error getting device parameters: %s", e)
         return f"Error getting device parameters: {str(e)}"
 
-@mcp.tool()
-def set_device_parameter(ctx: Context, track_index: int, device_index: int,
+@_tool()
+async def set_device_parameter(ctx: Context, track_index: int, device_index: int,
                          parameter_name: Optional[str] = None,
                          parameter_index: Optional[int] = None,
                          value: Optional[Union[float, int, str]] = None,
@@ -810,6 +1349,9 @@ def set_device_parameter(ctx: Context, track_index: int, device_index: int,
     """
     Set one or multiple device parameters.
 
+    Prefer the parameters list when setting more than one value on a device:
+    the whole list is applied in a single round-trip to Ableton.
+
     For single parameter:
     - track_index: The index of the track containing the device
     - device_index: The index of the device on the track
@@ -834,26 +1376,37 @@ def set_device_parameter(ctx: Context, track_index: int, device_index: int,
             if parameter_name is not None or parameter_index is not None or value is not None:
                 return "Error: Cannot use both single parameter arguments and parameters list"
 
-            if not isinstance(parameters, list) or len(parameters) == 0:
+            if not parameters or not isinstance(parameters, list):
                 return "Error: parameters must be a non-empty list"
 
-            ableton = get_ableton_connection()
-            result = ableton.send_command("set_device_parameters", {
+            # Reject malformed entries here rather than sending a batch Ableton can only refuse
+            invalid = next((p for p in parameters
+                            if not isinstance(p, dict) or "value" not in p
+                            or ("parameter_name" not in p and "parameter_index" not in p)), None)
+            if invalid is not None:
+                return (f"Error: Invalid parameter entry {invalid}; each entry needs 'value' and "
+                        f"either 'parameter_name' or 'parameter_index'")
+
+            ableton = await get_ableton_connection()
+            result = await ableton.send_command("set_device_parameters", {
                 "track_index": track_index,
                 "device_index": device_index,
-                "parameters": parameters
+                **_parameter_columns((track_index, device_index), parameters)
             })
 
-            if "results" in result:
-                success_count = sum(1 for r in result["results"] if r.get("success", False))
-                total_count = len(result["results"])
-                summary = f"Set {success_count}/{total_count} parameters on device '{result['device_name']}':\n"
-                for r in result["results"]:
+            results = result.get("results")
+            if results is not None:
+                for entry, r in zip(parameters, results):
                     if r.get("success"):
-                        summary += f"  ✓ {r['parameter_name']}: {r['value']}\n"
-                    else:
-                        summary += f"  ✗ {r.get('parameter_name', 'unknown')}: {r.get('error', 'unknown error')}\n"
-                return summary.rstrip()
+                        _remember_parameter_index((track_index, device_index), entry, r)
+                success_count = sum(1 for r in results if r.get("success", False))
+                lines = [f"Set {success_count}/{len(results)} parameters on device '{result['device_name']}':"]
+                lines.extend(
+                    f"  ✓ {r['parameter_name']}: {r['value']}" if r.get("success")
+                    else f"  ✗ {r.get('parameter_name', 'unknown')}: {r.get('error', 'unknown error')}"
+                    for r in results
+                )
+                return "\n".join(lines)
             else:
                 return f"Failed to set parameters: {result.get('message', 'Unknown error')}"
         else:
@@ -864,29 +1417,33 @@ def set_device_parameter(ctx: Context, track_index: int, device_index: int,
             if value is None:
                 return "Error: Value must be provided for single parameter mode"
 
-            ableton = get_ableton_connection()
-            result = ableton.send_command("set_device_parameter", {
-                "track_index": track_index,
-                "device_index": device_index,
-                "parameter_name": parameter_name,
-                "parameter_index": parameter_index,
-                "value": value
-            })
+            entry = {"parameter_name": parameter_name, "parameter_index": parameter_index, "value": value}
+            if _parameter_coalescer.window > 0:
+                # Concurrent sets on this device share one set_device_parameters round-trip
+                result = await _parameter_coalescer.submit((track_index, device_index), entry)
+            else:
+                ableton = await get_ableton_connection()
+                result = await ableton.send_command("set_device_parameter", {
+                    "track_index": track_index,
+                    "device_index": device_index,
+                    **_with_index_hint((track_index, device_index), entry)
+                })
 
             if "parameter_name" in result:
+                _remember_parameter_index((track_index, device_index), entry, result)
                 return f"Set parameter '{result['parameter_name']}' of device '{result['device_name']}' to {result['value']}"
             else:
                 return f"Failed to set parameter: {result.get('message', 'Unknown error')}"
     except Exception as e:
-        logger.error(f"Error setting device parameter(s): {str(e)}")
+        logger.error("Error setting device parameter(s): %s", e)
         return f"Error setting device parameter(s): {str(e)}"
 
 # ============================================================================
 # MACRO CONTROL TOOLS
 # ============================================================================
 
-@mcp.tool()
-def get_rack_chain_devices(ctx: Context, track_index: int, device_index: int, chain_index: int = 0) -> str:
+@_tool()
+async def get_rack_chain_devices(ctx: Context, track_index: int, device_index: int, chain_index: int = 0) -> str:
     """
     Get all devices inside a rack's chain.
 
@@ -900,57 +1457,58 @@ def get_rack_chain_devices(ctx: Context, track_index: int, device_index: int, ch
 
     Use this to discover what devices (like plugins) are inside a rack.
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_rack_chain_devices", {
-            "track_index": track_index,
-            "device_index": device_index,
-            "chain_index": chain_index
-        })
-
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting rack chain devices: {str(e)}")
-        return f"Error getting rack chain devices: {str(e)}"
-
-@mcp.tool()
-def get_rack_chain_device_parameters(
+    return await _run_command("get_rack_chain_devices", {
+        "track_index": track_index,
+        "device_index": device_index,
+        "chain_index": chain_index
+    }, action="getting rack chain devices")
+
+@_tool()
+async def get_rack_chain_device_parameters(
     ctx: Context,
     track_index: int,
     device_index: int,
     chain_index: int,
-    chain_device_index: int
+    chain_device_index: int,
+    offset: int = 0,
+    page_size: Optional[int] = None,
+    summary_only: bool = False
 ) -> str:
     """
-    Get parameters from a device inside a rack's chain.
+    Get parameters from a device inside a rack's chain, optionally one page at a time.
 
     Parameters:
     - track_index: The index of the track containing the rack
     - device_index: The index of the rack device
     - chain_index: The index of the chain (usually 0)
     - chain_device_index: The index of the device inside the chain
+    - offset: Parameter index to start the page at (default 0)
+    - page_size: Number of parameter indices the page covers (default: all of them from offset on)
+    - summary_only: Return only index and name per parameter
 
     Returns:
-    - JSON string with all parameters for the device inside the rack
+    - JSON string with the page of parameters for the device inside the rack,
+      plus next_offset (null after the last page)
 
     Use this to get parameters from 3rd party plugins inside racks.
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_rack_chain_device_parameters", {
+        result = await _get_parameters("get_rack_chain_device_parameters", {
             "track_index": track_index,
             "device_index": device_index,
             "chain_index": chain_index,
-            "chain_device_index": chain_device_index
+            "chain_device_index": chain_device_index,
+            "offset": offset,
+            "page_size": page_size,
+            "summary_only": summary_only
         })
-
-        return json.dumps(result, indent=2)
+        return _format_json(result)
     except Exception as e:
-        logger.error(f"Error getting rack chain device parameters: {str(e)}")
+        logger.error("Error getting rack chain device parameters: %s", e)
         return f"Error getting rack chain device parameters: {str(e)}"
 
-@mcp.tool()
-def map_parameter_to_macro(
+@_tool()
+async def map_parameter_to_macro(
     ctx: Context,
     track_index: int,
     device_index: int,
@@ -986,8 +1544,8 @@ def map_parameter_to_macro(
         if macro_index < 0 or macro_index > 7:
             return "Error: macro_index must be between 0 and 7"
 
-        ableton = get_ableton_connection()
-        result = ableton.send_command("map_parameter_to_macro", {
+        ableton = await get_ableton_connection()
+        result = await ableton.send_command("map_parameter_to_macro", {
             "track_index": track_index,
             "device_index": device_index,
             "chain_index": chain_index,
@@ -996,13 +1554,13 @@ def map_parameter_to_macro(
             "macro_index": macro_index
         })
 
-        return json.dumps(result, indent=2)
+        return _compact_json(result)
     except Exception as e:
-        logger.error(f"Error mapping parameter to macro: {str(e)}")
+        logger.error("Error mapping parameter to macro: %s", e)
         return f"Error mapping parameter to macro: {str(e)}"
 
-@mcp.tool()
-def get_rack_macro_mappings(ctx: Context, track_index: int, device_index: int) -> str:
+@_tool()
+async def get_rack_macro_mappings(ctx: Context, track_index: int, device_index: int) -> str:
     """
     Get all macro mappings for a Device Rack.
 
@@ -1015,24 +1573,17 @@ def get_rack_macro_mappings(ctx: Context, track_index: int, device_index: int) -
 
     Use this to see what macros are available in a rack device.
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_rack_macro_mappings", {
-            "track_index": track_index,
-            "device_index": device_index
-        })
-
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting rack macro mappings: {str(e)}")
-        return f"Error getting rack macro mappings: {str(e)}"
+    return await _run_command("get_rack_macro_mappings", {
+        "track_index": track_index,
+        "device_index": device_index
+    }, action="getting rack macro mappings", compact=True)
 
 # ============================================================================
 # NOTE MANIPULATION TOOLS
 # ============================================================================
 
-@mcp.tool()
-def remove_notes_from_clip(
+@_tool()
+async def remove_notes_from_clip(
     ctx: Context,
     track_index: int,
     clip_index: int,
@@ -1055,23 +1606,21 @@ def remove_notes_from_clip(
     - to_pitch: End pitch 0-127 (for range removal)
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("remove_notes_from_clip", {
-            "track_index": track_index,
-            "clip_index": clip_index,
+        # Removals on the same clip that arrive together share one round-trip
+        result = await _note_removal_coalescer.submit((track_index, clip_index), {
             "note_ids": note_ids,
             "from_time": from_time,
             "to_time": to_time,
             "from_pitch": from_pitch,
             "to_pitch": to_pitch
         })
-        return json.dumps(result, indent=2)
+        return _compact_json(result)
     except Exception as e:
-        logger.error(f"Error removing notes: {str(e)}")
+        logger.error("Error removing notes: %s", e)
         return f"Error removing notes: {str(e)}"
 
-@mcp.tool()
-def modify_notes_in_clip(
+@_tool()
+async def modify_notes_in_clip(
     ctx: Context,
     track_index: int,
     clip_index: int,
@@ -1088,19 +1637,15 @@ def modify_notes_in_clip(
       (e.g., [{"note_id": 123, "pitch": 60, "velocity": 100}])
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("modify_notes_in_clip", {
-            "track_index": track_index,
-            "clip_index": clip_index,
-            "modifications": modifications
-        })
-        return json.dumps(result, indent=2)
+        # Modifications on the same clip that arrive together share one round-trip
+        result = await _note_modification_coalescer.submit((track_index, clip_index), modifications)
+        return _compact_json(result)
     except Exception as e:
-        logger.error(f"Error modifying notes: {str(e)}")
+        logger.error("Error modifying notes: %s", e)
         return f"Error modifying notes: {str(e)}"
 
-@mcp.tool()
-def select_notes_from_clip(
+@_tool()
+async def select_notes_from_clip(
     ctx: Context,
     track_index: int,
     clip_index: int,
@@ -1120,293 +1665,259 @@ def select_notes_from_clip(
     - from_pitch: Start pitch 0-127
     - to_pitch: End pitch 0-127
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("select_notes_from_clip", {
-            "track_index": track_index,
-            "clip_index": clip_index,
-            "from_time": from_time,
-            "to_time": to_time,
-            "from_pitch": from_pitch,
-            "to_pitch": to_pitch
-        })
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error selecting notes: {str(e)}")
-        return f"Error selecting notes: {str(e)}"
+    return await _run_command("select_notes_from_clip", {
+        "track_index": track_index,
+        "clip_index": clip_index,
+        "from_time": from_time,
+        "to_time": to_time,
+        "from_pitch": from_pitch,
+        "to_pitch": to_pitch
+    }, action="selecting notes")
 
 # ============================================================================
 # TRACK & MIXER CONTROL TOOLS
 # ============================================================================
 
-@mcp.tool()
-def set_track_volume(ctx: Context, track_index: int, volume: float) -> str:
-    """Set track volume (0.0 to 1.0, where 0.85 ≈ 0dB)"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_track_volume", {"track_index": track_index, "volume": volume})
-        return f"Set track {track_index} volume to {volume}"
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool()
-def set_track_pan(ctx: Context, track_index: int, pan: float) -> str:
-    """Set track pan (-1.0 = left, 0.0 = center, 1.0 = right)"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_track_pan", {"track_index": track_index, "pan": pan})
-        return f"Set track {track_index} pan to {pan}"
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool()
-def set_track_mute(ctx: Context, track_index: int, mute: bool) -> str:
-    """Set track mute state"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_track_mute", {"track_index": track_index, "mute": mute})
-        return f"Set track {track_index} mute to {mute}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+@_tool()
+async def set_track_volume(ctx: Context, track_index: int, volume: float, wait: bool = False) -> str:
+    """Set track volume (0.0 to 1.0, where 0.85 ≈ 0dB); queued without waiting for Ableton unless wait=True"""
+    return await _run_command("set_track_volume", {"track_index": track_index, "volume": volume},
+                              message=f"Set track {track_index} volume to {volume}",
+                              wait=wait)
+
+@_tool()
+async def set_track_pan(ctx: Context, track_index: int, pan: float, wait: bool = False) -> str:
+    """Set track pan (-1.0 = left, 0.0 = center, 1.0 = right); queued without waiting for Ableton unless wait=True"""
+    return await _run_command("set_track_pan", {"track_index": track_index, "pan": pan},
+                              message=f"Set track {track_index} pan to {pan}",
+                              wait=wait)
+
+@_tool()
+async def set_track_mute(ctx: Context, track_index: int, mute: bool, wait: bool = False) -> str:
+    """Set track mute state; queued without waiting for Ableton unless wait=True"""
+    return await _run_command("set_track_mute", {"track_index": track_index, "mute": mute},
+                              message=f"Set track {track_index} mute to {mute}",
+                              wait=wait)
+
+@_tool()
+async def set_track_solo(ctx: Context, track_index: int, solo: bool, wait: bool = False) -> str:
+    """Set track solo state; queued without waiting for Ableton unless wait=True"""
+    return await _run_command("set_track_solo", {"track_index": track_index, "solo": solo},
+                              message=f"Set track {track_index} solo to {solo}",
+                              wait=wait)
+
+@_tool()
+async def set_track_arm(ctx: Context, track_index: int, arm: bool, wait: bool = False) -> str:
+    """Set track arm/record enable state; queued without waiting for Ableton unless wait=True"""
+    return await _run_command("set_track_arm", {"track_index": track_index, "arm": arm},
+                              message=f"Set track {track_index} arm to {arm}",
+                              wait=wait)
+
+@_tool()
+async def set_many_track_volumes(ctx: Context, volumes: List[Dict[str, Union[int, float]]]) -> str:
+    """
+    Set the volume of several tracks at once.
 
-@mcp.tool()
-def set_track_solo(ctx: Context, track_index: int, solo: bool) -> str:
-    """Set track solo state"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_track_solo", {"track_index": track_index, "solo": solo})
-        return f"Set track {track_index} solo to {solo}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    Parameters:
+    - volumes: List of dictionaries, each containing 'track_index' (int) and
+      'volume' (0.0 to 1.0, where 0.85 ≈ 0dB)
+      Example: [{"track_index": 0, "volume": 0.85}, {"track_index": 1, "volume": 0.6}]
 
-@mcp.tool()
-def set_track_arm(ctx: Context, track_index: int, arm: bool) -> str:
-    """Set track arm/record enable state"""
+    Returns:
+    - String with the result of the operation
+    """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_track_arm", {"track_index": track_index, "arm": arm})
-        return f"Set track {track_index} arm to {arm}"
+        if not isinstance(volumes, list) or len(volumes) == 0:
+            return "Error: volumes must be a non-empty list"
+
+        # Pipelined on one connection; the Remote Script applies them in order
+        ableton = await get_ableton_connection()
+        outcomes = await ableton.send_batch([
+            ("set_track_volume", {"track_index": v["track_index"], "volume": v["volume"]})
+            for v in volumes
+        ])
+        failures = [(v, outcome) for v, outcome in zip(volumes, outcomes) if isinstance(outcome, Exception)]
+        lines = [f"Set volume on {len(volumes) - len(failures)}/{len(volumes)} tracks"]
+        lines.extend(f"  ✗ Track {v['track_index']}: {str(e)}" for v, e in failures)
+        return "\n".join(lines)
     except Exception as e:
-        return f"Error: {str(e)}"
+        logger.error("Error setting track volumes: %s", e)
+        return f"Error setting track volumes: {str(e)}"
 
-@mcp.tool()
-def delete_track(ctx: Context, track_index: int) -> str:
+@_tool()
+async def delete_track(ctx: Context, track_index: int) -> str:
     """Delete a track"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("delete_track", {"track_index": track_index})
-        return f"Deleted track {track_index}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("delete_track", {"track_index": track_index},
+                              message=f"Deleted track {track_index}")
 
-@mcp.tool()
-def duplicate_track(ctx: Context, track_index: int) -> str:
+@_tool()
+async def duplicate_track(ctx: Context, track_index: int) -> str:
     """Duplicate a track"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("duplicate_track", {"track_index": track_index})
-        return f"Duplicated track {track_index} to index {result.get('new_track_index')}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("duplicate_track", {"track_index": track_index},
+                              fmt=lambda result: f"Duplicated track {track_index} to index {result.get('new_track_index')}")
 
 # ============================================================================
 # CLIP CONTROL TOOLS
 # ============================================================================
 
-@mcp.tool()
-def get_clip_info(ctx: Context, track_index: int, clip_index: int) -> str:
+@_tool()
+async def get_clip_info(ctx: Context, track_index: int, clip_index: int) -> str:
     """Get detailed information about a clip"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_clip_info", {"track_index": track_index, "clip_index": clip_index})
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("get_clip_info", {"track_index": track_index, "clip_index": clip_index})
 
-@mcp.tool()
-def delete_clip(ctx: Context, track_index: int, clip_index: int) -> str:
+@_tool()
+async def delete_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     """Delete a clip"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("delete_clip", {"track_index": track_index, "clip_index": clip_index})
-        return f"Deleted clip at track {track_index}, slot {clip_index}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("delete_clip", {"track_index": track_index, "clip_index": clip_index},
+                              message=f"Deleted clip at track {track_index}, slot {clip_index}")
 
-@mcp.tool()
-def duplicate_clip(ctx: Context, track_index: int, clip_index: int) -> str:
+@_tool()
+async def duplicate_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     """Duplicate a clip to the next available slot"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("duplicate_clip", {"track_index": track_index, "clip_index": clip_index})
-        return f"Duplicated clip to slot {result.get('target_clip_index')}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("duplicate_clip", {"track_index": track_index, "clip_index": clip_index},
+                              fmt=lambda result: f"Duplicated clip to slot {result.get('target_clip_index')}")
 
-@mcp.tool()
-def set_clip_loop(ctx: Context, track_index: int, clip_index: int, loop_start: float, loop_end: Optional[float] = None, loop_enabled: bool = True) -> str:
+@_tool()
+async def set_clip_loop(ctx: Context, track_index: int, clip_index: int, loop_start: float, loop_end: Optional[float] = None, loop_enabled: bool = True) -> str:
     """Set clip loop parameters"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_clip_loop", {
-            "track_index": track_index,
-            "clip_index": clip_index,
-            "loop_start": loop_start,
-            "loop_end": loop_end,
-            "loop_enabled": loop_enabled
-        })
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool()
-def set_clip_color(ctx: Context, track_index: int, clip_index: int, color: int) -> str:
+    return await _run_command("set_clip_loop", {
+        "track_index": track_index,
+        "clip_index": clip_index,
+        "loop_start": loop_start,
+        "loop_end": loop_end,
+        "loop_enabled": loop_enabled
+    }, compact=True)
+
+@_tool()
+async def set_clip_color(ctx: Context, track_index: int, clip_index: int, color: int) -> str:
     """Set clip color (color index 0-69)"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_clip_color", {"track_index": track_index, "clip_index": clip_index, "color": color})
-        return f"Set clip color to {color}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("set_clip_color", {"track_index": track_index, "clip_index": clip_index, "color": color},
+                              message=f"Set clip color to {color}")
 
 # ============================================================================
 # AUTOMATION TOOLS
 # ============================================================================
 
-@mcp.tool()
-def add_automation_point(ctx: Context, track_index: int, device_index: int, parameter_index: int, time: float, value: float) -> str:
-    """Add an automation point to a parameter"""
+@_tool()
+async def add_automation_point(ctx: Context, track_index: int, device_index: int, parameter_index: int, time: float, value: float) -> str:
+    """Add an automation point to a parameter (use add_automation_points for whole curves)"""
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("add_automation_point", {
-            "track_index": track_index,
-            "device_index": device_index,
-            "parameter_index": parameter_index,
-            "time": time,
-            "value": value
-        })
-        return json.dumps(result, indent=2)
+        # Points on the same parameter that arrive together share one round-trip
+        result = await _automation_coalescer.submit((track_index, device_index, parameter_index),
+                                                    {"time": time, "value": value})
+        return _compact_json(result)
     except Exception as e:
+        logger.error("Error adding automation point: %s", e)
         return f"Error: {str(e)}"
 
-@mcp.tool()
-def clear_automation(ctx: Context, track_index: int, device_index: int, parameter_index: int) -> str:
+@_tool()
+async def add_automation_points(ctx: Context, track_index: int, device_index: int, parameter_index: int,
+                                points: List[Dict[str, float]]) -> str:
+    """
+    Add several automation points to a parameter in one operation.
+
+    Parameters:
+    - track_index: The index of the track containing the device
+    - device_index: The index of the device on the track
+    - parameter_index: The index of the parameter to automate
+    - points: List of dictionaries with 'time' (in beats) and 'value'
+      Example: [{"time": 0.0, "value": 0.2}, {"time": 4.0, "value": 0.8}]
+    """
+    if not isinstance(points, list) or len(points) == 0:
+        return "Error: points must be a non-empty list"
+    return await _run_command("add_automation_points", {
+        "track_index": track_index,
+        "device_index": device_index,
+        "parameter_index": parameter_index,
+        "points": points
+    }, fmt=lambda result: f"Added {result.get('added', 0)} automation points to parameter {parameter_index}")
+
+@_tool()
+async def clear_automation(ctx: Context, track_index: int, device_index: int, parameter_index: int) -> str:
     """Clear automation for a parameter"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("clear_automation", {
-            "track_index": track_index,
-            "device_index": device_index,
-            "parameter_index": parameter_index
-        })
-        return f"Cleared automation for parameter {parameter_index}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("clear_automation", {
+        "track_index": track_index,
+        "device_index": device_index,
+        "parameter_index": parameter_index
+    }, message=f"Cleared automation for parameter {parameter_index}")
 
 # ============================================================================
 # SCENE CONTROL TOOLS
 # ============================================================================
 
-@mcp.tool()
-def get_scenes_info(ctx: Context) -> str:
+@_tool()
+async def get_scenes_info(ctx: Context) -> str:
     """Get information about all scenes"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_scenes_info")
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("get_scenes_info")
 
-@mcp.tool()
-def create_scene(ctx: Context, index: int = -1) -> str:
+@_tool()
+async def create_scene(ctx: Context, index: int = -1) -> str:
     """Create a new scene at index (-1 = end)"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("create_scene", {"index": index})
-        return f"Created scene at index {result.get('scene_index')}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("create_scene", {"index": index},
+                              fmt=lambda result: f"Created scene at index {result.get('scene_index')}")
 
-@mcp.tool()
-def delete_scene(ctx: Context, index: int) -> str:
+@_tool()
+async def delete_scene(ctx: Context, index: int) -> str:
     """Delete a scene"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("delete_scene", {"index": index})
-        return f"Deleted scene {index}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("delete_scene", {"index": index}, message=f"Deleted scene {index}")
 
-@mcp.tool()
-def fire_scene(ctx: Context, index: int) -> str:
+@_tool()
+async def fire_scene(ctx: Context, index: int) -> str:
     """Fire/trigger a scene"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("fire_scene", {"index": index})
-        return f"Fired scene {index}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("fire_scene", {"index": index}, message=f"Fired scene {index}")
 
 # ============================================================================
 # TRANSPORT & TIMING TOOLS
 # ============================================================================
 
-@mcp.tool()
-def get_playback_position(ctx: Context) -> str:
+@_tool()
+async def get_playback_position(ctx: Context) -> str:
     """Get current playback position and loop state"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_playback_position")
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool()
-def set_loop_start(ctx: Context, position: float) -> str:
-    """Set arrangement loop start position (in beats)"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_loop_start", {"position": position})
-        return f"Set loop start to {position}"
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool()
-def set_loop_end(ctx: Context, position: float) -> str:
-    """Set arrangement loop end position (in beats)"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_loop_end", {"position": position})
-        return f"Set loop end to {position}"
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool()
-def set_playback_position(ctx: Context, position: float) -> str:
-    """Set playback position (in beats)"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_playback_position", {"position": position})
-        return f"Set playback position to {position}"
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool()
-def set_metronome(ctx: Context, enabled: bool) -> str:
-    """Enable or disable metronome"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_metronome", {"enabled": enabled})
-        return f"Set metronome to {enabled}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("get_playback_position", compact=True)
+
+@_tool()
+async def set_loop_start(ctx: Context, position: float, wait: bool = False) -> str:
+    """Set arrangement loop start position (in beats); queued without waiting for Ableton unless wait=True"""
+    return await _run_command("set_loop_start", {"position": position},
+                              message=f"Set loop start to {position}",
+                              wait=wait)
+
+@_tool()
+async def set_loop_end(ctx: Context, position: float, wait: bool = False) -> str:
+    """Set arrangement loop end position (in beats); queued without waiting for Ableton unless wait=True"""
+    return await _run_command("set_loop_end", {"position": position},
+                              message=f"Set loop end to {position}",
+                              wait=wait)
+
+@_tool()
+async def set_playback_position(ctx: Context, position: float, wait: bool = False) -> str:
+    """Set playback position (in beats); queued without waiting for Ableton unless wait=True"""
+    return await _run_command("set_playback_position", {"position": position},
+                              message=f"Set playback position to {position}",
+                              wait=wait)
+
+@_tool()
+async def set_metronome(ctx: Context, enabled: bool, wait: bool = False) -> str:
+    """Enable or disable metronome; queued without waiting for Ableton unless wait=True"""
+    return await _run_command("set_metronome", {"enabled": enabled},
+                              message=f"Set metronome to {enabled}",
+                              wait=wait)
+
+@_tool()
+async def get_last_async_error(ctx: Context) -> str:
+    """Get and clear the last error from a setter that was queued without waiting"""
+    ableton = await get_ableton_connection()
+    error, ableton.last_async_error = ableton.last_async_error, None
+    if error is None:
+        return "No queued commands have failed"
+    return _format_json(error)
 
 # ============================================================================
 # ADVANCED TOOLS
 # ============================================================================
 
-@mcp.tool()
-def quantize_notes(ctx: Context, track_index: int, clip_index: int, quantize_to: float = 0.25) -> str:
+@_tool()
+async def quantize_notes(ctx: Context, track_index: int, clip_index: int, quantize_to: float = 0.25) -> str:
     """
     Quantize notes in a clip.
 
@@ -1415,19 +1926,14 @@ def quantize_notes(ctx: Context, track_index: int, clip_index: int, quantize_to:
     - clip_index: Clip slot index
     - quantize_to: Quantization grid in beats (0.25 = 16th note, 0.5 = 8th note, 1.0 = quarter note)
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("quantize_notes", {
-            "track_index": track_index,
-            "clip_index": clip_index,
-            "quantize_to": quantize_to
-        })
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool()
-def transpose_notes(ctx: Context, track_index: int, clip_index: int, semitones: int) -> str:
+    return await _run_command("quantize_notes", {
+        "track_index": track_index,
+        "clip_index": clip_index,
+        "quantize_to": quantize_to
+    }, compact=True)
+
+@_tool()
+async def transpose_notes(ctx: Context, track_index: int, clip_index: int, semitones: int) -> str:
     """
     Transpose all notes in a clip.
 
@@ -1436,37 +1942,211 @@ def transpose_notes(ctx: Context, track_index: int, clip_index: int, semitones:
     - clip_index: Clip slot index
     - semitones: Number of semitones to transpose (positive or negative)
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("transpose_notes", {
-            "track_index": track_index,
-            "clip_index": clip_index,
-            "semitones": semitones
-        })
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool()
-def create_audio_track(ctx: Context, index: int = -1) -> str:
+    return await _run_command("transpose_notes", {
+        "track_index": track_index,
+        "clip_index": clip_index,
+        "semitones": semitones
+    }, compact=True)
+
+@_tool()
+async def create_audio_track(ctx: Context, index: int = -1) -> str:
     """Create a new audio track at index (-1 = end)"""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("create_audio_track", {"index": index})
-        return f"Created audio track '{result.get('name')}' at index {result.get('index')}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await _run_command("create_audio_track", {"index": index},
+                              fmt=lambda result: f"Created audio track '{result.get('name')}' at index {result.get('index')}")
 
 # ============================================================================
 # PLUGIN SUPPORT TOOLS
 # ============================================================================
 
-@mcp.tool()
-def get_third_party_plugins(
+# Unfiltered plugin catalogs by command. The catalog only changes when plugins
+# are installed or rescanned, so one fetch serves every filter for a while
+_PLUGIN_TTL = 60.0
+_plugin_catalogs: Dict[str, tuple] = {}
+# Keys of every get_third_party_plugins entry
+_PLUGIN_FIELDS = frozenset(("name", "uri", "vendor", "format", "format_folder", "type"))
+# Serialized tool outputs kept per catalog, beyond which new ones aren't stored
+_PLUGIN_OUTPUTS_MAX = 256
+# Fields each catalog is indexed on, _filter_key(value) -> catalog positions
+_PLUGIN_INDEX_FIELDS = {
+    "get_third_party_plugins": ("vendor", "type", "format", "format_folder"),
+    "get_plugins_list": ("category",),
+}
+
+def _filter_key(value: Any) -> str:
+    """
+    Normalize a catalog value or filter argument for matching.
+
+    Case and surrounding spaces don't matter ("fabfilter " finds FabFilter). Keys
+    are interned, so a lookup with a key seen before compares by identity.
+    """
+    return sys.intern(str(value).strip().casefold())
+
+def _index_plugins(plugins: List[Dict[str, Any]], fields: tuple) -> Dict[str, Dict[str, List[int]]]:
+    """Build an inverted index per field, in catalog order; missing or null values aren't indexed"""
+    index: Dict[str, Dict[str, List[int]]] = {name: {} for name in fields}
+    for position, plugin in enumerate(plugins):
+        for name in fields:
+            value = plugin.get(name)
+            if value is not None:
+                index[name].setdefault(_filter_key(value), []).append(position)
+    return index
+
+async def _get_plugin_catalog(command_type: str, params: Dict[str, Any] = None,
+                              refresh: bool = False) -> tuple:
+    """
+    Fetch a full plugin catalog and its indexes, reusing a recent one.
+
+    Also returns the dict of tool outputs already serialized from this catalog,
+    which expires and is replaced along with it (None when nothing was cached).
+    """
+    now = time.monotonic()
+    cached = _plugin_catalogs.get(command_type)
+    if not refresh and cached is not None and cached[0] > now:
+        return cached[1:]
+
+    ableton = await get_ableton_connection()
+    result = await ableton.send_command(command_type, params)
+    if "plugins" not in result:
+        return result, None, None
+    # Counted here once; the Remote Script doesn't send a count
+    result["count"] = len(result["plugins"])
+    index = _index_plugins(result["plugins"], _PLUGIN_INDEX_FIELDS[command_type])
+    _plugin_catalogs[command_type] = cached = (now + _PLUGIN_TTL, result, index, {})
+    return cached[1:]
+
+def _filter_plugins(plugins: List[Dict[str, Any]], index: Dict[str, Dict[str, List[int]]],
+                    creator: Optional[str], plugin_type: Optional[str],
+                    format: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Apply get_third_party_plugins filters the way the Remote Script used to.
+
+    A format filter matches either the format detected from the URI ("VST2") or
+    the browser folder the plugin was found in ("VST"), which is all the Remote
+    Script compared against.
+    """
+    candidates = None
+    # Creator is a case-insensitive substring match, so check it against each
+    # distinct vendor rather than each plugin
+    if creator:
+        creator = _filter_key(creator)
+        candidates = set()
+        for vendor, positions in index["vendor"].items():
+            if creator in vendor:
+                candidates.update(positions)
+    # Type and format are exact matches
+    if plugin_type:
+        positions = index["type"].get(_filter_key(plugin_type), ())
+        candidates = set(positions) if candidates is None else candidates.intersection(positions)
+    if format:
+        format = _filter_key(format)
+        positions = set(index["format"].get(format, ())).union(index["format_folder"].get(format, ()))
+        candidates = positions if candidates is None else candidates.intersection(positions)
+    if candidates is None:
+        return plugins
+    return [plugins[position] for position in sorted(candidates)]
+
+# Compressed output is only worth it for listings at least this long
+_COMPRESS_MIN_BYTES = 4096
+_zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard is not None else None
+
+def _plugin_output(obj: Dict[str, Any], pretty: bool, compress: bool) -> str:
+    """
+    Serialize a plugin tool result.
+
+    With compress=True a long result comes back as {"encoding", "data"}, where
+    data is the base64 of the compressed JSON and encoding is "zstd+b64" or
+    "zlib+b64". Shorter results are returned as plain JSON either way.
+    """
+    payload = _format_json(obj) if pretty else _compact_json(obj)
+    if not compress:
+        return payload
+    # The cutoff is in bytes; non-ASCII names take more than one each
+    data = payload.encode('utf-8')
+    if len(data) < _COMPRESS_MIN_BYTES:
+        return payload
+    if _zstd_compressor is not None:
+        encoding, data = "zstd+b64", _zstd_compressor.compress(data)
+    else:
+        encoding, data = "zlib+b64", zlib.compress(data)
+    return _compact_json({"encoding": encoding, "data": base64.b64encode(data).decode('ascii')})
+
+def _plugin_error(action: str, e: Exception) -> str:
+    """Log a failed plugin tool call and report it as JSON, like the tool's normal output"""
+    logger.error("Error %s: %s", action, e)
+    return _compact_json({"error": f"Error {action}: {e}"})
+
+async def _run_plugin_tool(command_type: str, build: Callable[[Dict[str, Any], Any], Dict[str, Any]],
+                           action: str, params: Dict[str, Any] = None, refresh: bool = False,
+                           pretty: bool = False, compress: bool = False,
+                           key: Optional[tuple] = None) -> str:
+    """
+    Answer a plugin listing tool from the cached catalog for command_type.
+
+    build turns the catalog and its index into the tool's result. When key
+    identifies the call's arguments, the serialized output is kept with the
+    catalog and returned as-is for the same call until the catalog expires. A
+    response from Ableton without a plugins list is passed through unchanged,
+    and failures are reported with _plugin_error.
+    """
+    try:
+        result, index, outputs = await _get_plugin_catalog(command_type, params, refresh)
+        if "plugins" not in result:
+            return _plugin_output(result, pretty, compress)
+        if key is None:
+            return _plugin_output(build(result, index), pretty, compress)
+        key += (pretty, compress)
+        output = outputs.get(key)
+        if output is None:
+            output = _plugin_output(build(result, index), pretty, compress)
+            if len(outputs) < _PLUGIN_OUTPUTS_MAX:
+                outputs[key] = output
+        return output
+    except Exception as e:
+        return _plugin_error(action, e)
+
+def _third_party_result(catalog: Dict[str, Any], index: Dict[str, Dict[str, List[int]]],
+                        creator: Optional[str], plugin_type: Optional[str],
+                        format: Optional[str], fields: Optional[List[str]] = None,
+                        offset: int = 0, page_size: Optional[int] = None) -> Dict[str, Any]:
+    """Build one get_third_party_plugins result, or one page of it, from the cached catalog"""
+    paged = offset > 0 or page_size is not None
+    if creator is None and plugin_type is None and format is None and not fields and not paged:
+        # Nothing to filter or project: the catalog is the answer, no copy needed
+        return catalog
+    plugins = _filter_plugins(catalog["plugins"], index, creator, plugin_type, format)
+    total = len(plugins)
+    if paged:
+        offset = max(0, offset)
+        end = total if page_size is None else min(total, offset + max(1, page_size))
+        plugins = plugins[offset:end]
+    if fields:
+        # Settle which requested keys exist once, not for every plugin
+        fields = [name for name in fields if name in _PLUGIN_FIELDS]
+        plugins = [{name: plugin[name] for name in fields} for plugin in plugins]
+    result = {"plugins": plugins, "count": len(plugins)}
+    # Only the filters that were actually applied, and no entry at all without any
+    filters_applied = {name: value for name, value in (("creator", creator),
+                                                       ("plugin_type", plugin_type),
+                                                       ("format", format)) if value}
+    if filters_applied:
+        result["filters_applied"] = filters_applied
+    if paged:
+        result["total"] = total
+        result["next_offset"] = end if end < total else None
+    return result
+
+@_tool()
+async def get_third_party_plugins(
     ctx: Context,
     creator: Optional[str] = None,
     plugin_type: Optional[str] = None,
-    format: Optional[str] = None
+    format: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    offset: int = 0,
+    page_size: Optional[int] = None,
+    refresh: bool = False,
+    pretty: bool = False,
+    compress: bool = False
 ) -> str:
     """
     Get 3rd party VST/AU/AAX plugins ONLY (excludes Ableton native devices).
@@ -1476,7 +2156,19 @@ def get_third_party_plugins(
     - creator: Filter by plugin creator/manufacturer (e.g., "FabFilter", "Waves", "Arturia")
                Uses Ableton's native manufacturer metadata from the plugin.
     - plugin_type: Filter by type ("instrument", "audio_effect", "midi_effect")
-    - format: Filter by format ("VST2", "VST3", "AU", "AUv2", "AAX")
+    - format: Filter by format, as detected from the URI ("VST2", "VST3", "AU", "AUv2", "AAX")
+              or as the browser folder it is listed in ("VST", "VST3", "AUv2")
+    - fields: Only return these keys of each plugin, e.g. ["name", "uri"] when the
+              result just feeds load_instrument_or_effect (default: all keys)
+    - offset: Position in the matching plugins to start the page at (default 0)
+    - page_size: Number of plugins per page (default: all matches in one response).
+                 Paged responses also hold 'total' (all matches) and 'next_offset'
+                 (offset of the next page, or null after the last page)
+    - refresh: Re-read the catalog from Ableton instead of reusing one from the last minute
+               (e.g. after installing or rescanning plugins)
+    - pretty: Indent the JSON for reading (default: compact, one line)
+    - compress: Return a long result as {"encoding": "zstd+b64" or "zlib+b64", "data": ...},
+                the base64 of the compressed JSON (default: plain JSON)
 
     Returns JSON with plugins array. Each plugin contains:
     {
@@ -1484,9 +2176,13 @@ def get_third_party_plugins(
       "uri": "query:Plugins#...",         // URI for loading (use with load_instrument_or_effect)
       "vendor": "FabFilter",              // Creator/manufacturer (from Ableton's native metadata)
       "format": "VST2",                   // Plugin format (detected from URI)
+      "format_folder": "VST",             // Browser folder the plugin is listed in
       "type": "audio_effect"              // Plugin type (detected from name)
     }
 
+    Large catalogs can be read a page at a time: start with offset=0 and a
+    page_size, then pass next_offset back until it is null.
+
     Examples:
     - get_third_party_plugins(creator="FabFilter") → All FabFilter plugins
     - get_third_party_plugins(plugin_type="audio_effect") → All 3rd party effects
@@ -1498,35 +2194,64 @@ def get_third_party_plugins(
     2. Find desired plugin in results (the 'vendor' field contains the manufacturer)
     3. Use load_instrument_or_effect(track_index, plugin['uri']) to load it
     """
-    try:
-        ableton = get_ableton_connection()
-        # Send filters to Ableton for efficient filtering at the browser level
-        result = ableton.send_command("get_third_party_plugins", {
-            "creator": creator,
-            "plugin_type": plugin_type,
-            "format": format
-        })
+    return await _run_plugin_tool(
+        "get_third_party_plugins",
+        lambda catalog, index: _third_party_result(catalog, index, creator, plugin_type, format,
+                                                   fields, offset, page_size),
+        "getting third party plugins", refresh=refresh, pretty=pretty, compress=compress,
+        key=(creator, plugin_type, format, tuple(fields) if fields else None, offset, page_size))
+
+@_tool()
+async def get_third_party_plugins_batch(
+    ctx: Context,
+    queries: List[Dict[str, Any]],
+    fields: Optional[List[str]] = None,
+    refresh: bool = False,
+    pretty: bool = False,
+    compress: bool = False
+) -> str:
+    """
+    Run several get_third_party_plugins queries in one call.
 
-        if "plugins" not in result:
-            return json.dumps(result, indent=2)
-
-        filtered_result = {
-            "plugins": result["plugins"],
-            "count": result["count"],
-            "filters_applied": {
-                "creator": creator,
-                "plugin_type": plugin_type,
-                "format": format
-            }
-        }
-
-        return json.dumps(filtered_result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting third party plugins: {str(e)}")
-        return f"Error getting third party plugins: {str(e)}"
+    Parameters:
+    - queries: List of filter sets, each a dictionary with any of 'creator',
+      'plugin_type' and 'format' (same meaning as in get_third_party_plugins)
+      Example: [{"creator": "FabFilter"}, {"creator": "Waves", "plugin_type": "audio_effect"}]
+    - fields: Only return these keys of each plugin, e.g. ["name", "uri"] (default: all keys)
+    - refresh: Re-read the catalog from Ableton instead of reusing one from the last minute
+    - pretty: Indent the JSON for reading (default: compact, one line)
+    - compress: Return a long result as {"encoding": "zstd+b64" or "zlib+b64", "data": ...},
+                the base64 of the compressed JSON (default: plain JSON)
+
+    All queries are answered from a single read of the plugin catalog.
 
-@mcp.tool()
-def get_plugins_list(ctx: Context, plugin_type: str = "all") -> str:
+    Returns:
+    - JSON with a results list holding one get_third_party_plugins result per query,
+      in order. Each plugin contains:
+      {
+        "name": "FabFilter Pro-Q 3",        // Full plugin name
+        "uri": "query:Plugins#...",         // URI for loading (use with load_instrument_or_effect)
+        "vendor": "FabFilter",              // Creator/manufacturer (from Ableton's native metadata)
+        "format": "VST2",                   // Plugin format (detected from URI)
+        "format_folder": "VST",             // Browser folder the plugin is listed in
+        "type": "audio_effect"              // Plugin type (detected from name)
+      }
+    """
+    if not isinstance(queries, list) or len(queries) == 0:
+        return _compact_json({"error": "Error: queries must be a non-empty list"})
+
+    return await _run_plugin_tool(
+        "get_third_party_plugins",
+        lambda catalog, index: {"results": [
+            _third_party_result(catalog, index, query.get("creator"), query.get("plugin_type"),
+                                query.get("format"), fields)
+            for query in queries
+        ]},
+        "getting third party plugins", refresh=refresh, pretty=pretty, compress=compress)
+
+@_tool()
+async def get_plugins_list(ctx: Context, plugin_type: str = "all", refresh: bool = False,
+                           pretty: bool = False, compress: bool = False) -> str:
     """
     Get list of available plugins from Ableton's browser (includes native + 3rd party).
 
@@ -1535,17 +2260,112 @@ def get_plugins_list(ctx: Context, plugin_type: str = "all") -> str:
 
     Parameters:
     - plugin_type: Type of plugins ('all', 'instruments', 'audio_effects', 'midi_effects')
+    - refresh: Re-read the browser instead of reusing a listing from the last minute
+    - pretty: Indent the JSON for reading (default: compact, one line)
+    - compress: Return a long result as {"encoding": "zstd+b64" or "zlib+b64", "data": ...},
+                the base64 of the compressed JSON (default: plain JSON)
 
     Returns:
     - JSON with plugins array containing {name, uri, category}
     """
+    def build(catalog: Dict[str, Any], index: Dict[str, Dict[str, List[int]]]) -> Dict[str, Any]:
+        # Every listing includes the Plug-Ins category; the rest is one category or all of them
+        plugins = catalog["plugins"]
+        if plugin_type != "all":
+            categories = index["category"]
+            # A set, so plugin_type="plugins" doesn't list the Plug-Ins category twice
+            positions = set(categories.get("plugins", ())).union(categories.get(_filter_key(plugin_type), ()))
+            plugins = [plugins[position] for position in sorted(positions)]
+        return {"plugins": plugins, "count": len(plugins), "plugin_type": plugin_type}
+
+    return await _run_plugin_tool("get_plugins_list", build, "getting plugins list",
+                                  {"plugin_type": "all"}, refresh, pretty, compress, (plugin_type,))
+
+@_tool()
+async def invalidate_plugin_cache(ctx: Context) -> str:
+    """
+    Forget the cached plugin catalogs so the next plugin listing re-reads Ableton's browser.
+    Use this after installing or rescanning plugins.
+    """
+    _plugin_catalogs.clear()
+    return "Plugin cache cleared"
+
+# ============================================================================
+# BATCH EXECUTION
+# ============================================================================
+
+# Tool results that report a failure: plain "Error ..." or "Failed to ..." text,
+# load_drum_kit's partial failures, or a JSON error object from the tools whose
+# output is always JSON
+_ERROR_PREFIXES = ("Error", "Failed", "Loaded drum rack but", '{"error":')
+
+def _is_single_parameter_set(op: Dict[str, Any]) -> bool:
+    return op.get("tool") == "set_device_parameter" and "parameters" not in op.get("args", {})
+
+async def _call_tool(ctx: Context, op: Dict[str, Any]) -> tuple:
+    """Call one run_batch operation's tool function directly; returns (result, failed)"""
+    result = await _call_tool_result(ctx, op)
+    return result, result.startswith(_ERROR_PREFIXES)
+
+async def _call_tool_result(ctx: Context, op: Dict[str, Any]) -> str:
+    fn = _TOOL_REGISTRY.get(op.get("tool"))
+    if fn is None or fn is run_batch:
+        return f"Error: Unknown tool '{op.get('tool')}'"
+    args = op.get("args", {})
+    if op.get("tool") in _WAITABLE_TOOLS:
+        # Wait for the reply, so the operation is applied before the next one
+        # starts and a failure stops the batch
+        args = {**args, "wait": True}
+    try:
+        return await fn(ctx, **args)
+    except TypeError as e:
+        return f"Error: Invalid arguments for '{op.get('tool')}': {str(e)}"
+
+@_tool()
+async def run_batch(ctx: Context, ops: List[Dict[str, Any]], continue_on_error: bool = False) -> str:
+    """
+    Run several tools in one call, in order.
+
+    Parameters:
+    - ops: List of operations, each a dictionary with 'tool' (the tool name) and
+      'args' (a dictionary of that tool's arguments, without ctx)
+      Example: [{"tool": "create_midi_track", "args": {"index": -1}},
+                {"tool": "set_track_volume", "args": {"track_index": 0, "volume": 0.7}}]
+    - continue_on_error: Keep going after an operation fails (default: stop at the first failure)
+
+    Consecutive single-parameter set_device_parameter operations are sent to
+    Ableton together, one round-trip per device (unless ABLETON_COALESCE_MS is 0,
+    which sends each one on its own). Setters that normally only queue their
+    command (wait=False) wait for Ableton here, so each operation is applied
+    before the next and its failure is reported.
+
+    Returns:
+    - JSON list with each operation's tool name and result
+    """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_plugins_list", {"plugin_type": plugin_type})
-        return json.dumps(result, indent=2)
+        if not isinstance(ops, list) or len(ops) == 0:
+            return "Error: ops must be a non-empty list"
+
+        results = []
+        position = 0
+        while position < len(ops):
+            # A stretch of single-parameter sets runs concurrently so the coalescer
+            # merges it into one command per device; anything else runs on its own
+            end = position + 1
+            if _is_single_parameter_set(ops[position]):
+                while end < len(ops) and _is_single_parameter_set(ops[end]):
+                    end += 1
+            group = ops[position:end]
+            outcomes = await asyncio.gather(*(_call_tool(ctx, op) for op in group))
+            results.extend({"tool": op.get("tool"), "result": result} for op, (result, _) in zip(group, outcomes))
+            position = end
+            if not continue_on_error and any(failed for _, failed in outcomes):
+                break
+
+        return _format_json({"completed": len(results), "total": len(ops), "results": results})
     except Exception as e:
-        logger.error(f"Error getting plugins list: {str(e)}")
-        return f"Error getting plugins list: {str(e)}"
+        logger.error("Error running batch: %s", e)
+        return f"Error running batch: {str(e)}"
 
 # Main execution
 def main():
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from MCP_Server.server import _Coalescer
+
+
+class _RecordingSend:
+    """send() for a _Coalescer that records each batch and can be held open"""
+
+    def __init__(self):
+        self.batches = []
+        self.release = asyncio.Event()
+        self.hold = False
+
+    async def __call__(self, key, entries):
+        self.batches.append(list(entries))
+        if self.hold:
+            await self.release.wait()
+        return [entry * 10 for entry in entries]
+
+
+def test_cancelled_first_caller_does_not_strand_the_key():
+    async def scenario():
+        send = _RecordingSend()
+        coalescer = _Coalescer(0.01, send)
+        first = asyncio.create_task(coalescer.submit(("t", 0), 1))
+        await asyncio.sleep(0)
+        # Cancelled while the coalescing window is still open
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        # Later calls on the same key must still be flushed
+        assert await asyncio.wait_for(coalescer.submit(("t", 0), 2), 1.0) == 20
+        assert await asyncio.wait_for(coalescer.submit(("t", 0), 3), 1.0) == 30
+        return send.batches
+
+    # The cancelled entry was dropped before anything was sent
+    assert asyncio.run(scenario()) == [[2], [3]]
+
+
+def test_cancelled_later_caller_does_not_fail_the_others():
+    async def scenario():
+        send = _RecordingSend()
+        send.hold = True
+        coalescer = _Coalescer(0.01, send)
+        first = asyncio.create_task(coalescer.submit(("t", 0), 1))
+        second = asyncio.create_task(coalescer.submit(("t", 0), 2))
+        third = asyncio.create_task(coalescer.submit(("t", 0), 3))
+        # Let the window pass so the batch is being sent, then cancel a caller
+        while not send.batches:
+            await asyncio.sleep(0.005)
+        second.cancel()
+        send.release.set()
+        results = await asyncio.wait_for(asyncio.gather(first, third), 1.0)
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        return results, send.batches
+
+    results, batches = asyncio.run(scenario())
+    assert results == [10, 30]
+    assert batches == [[1, 2, 3]]
+
+
+def test_zero_window_sends_each_call_on_its_own():
+    async def scenario():
+        send = _RecordingSend()
+        coalescer = _Coalescer(0, send)
+        results = await asyncio.gather(*(coalescer.submit(("t", 0), entry) for entry in (1, 2, 3)))
+        return results, send.batches
+
+    results, batches = asyncio.run(scenario())
+    assert results == [10, 20, 30]
+    assert batches == [[1], [2], [3]]